@@ -13,10 +13,15 @@ from typing import TYPE_CHECKING
 import aiosqlite
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .types import RateLimitInfo
 
 logger = logging.getLogger(__name__)
 
+# Ids per "IN (...)" query; stays under SQLite's default 999 bound-variable limit.
+_IN_CLAUSE_BATCH = 500
+
 
 @dataclass
 class SessionRecord:
@@ -97,6 +102,26 @@ class SessionRepository:
                 return None
             return SessionRecord(**dict(row))
 
+    async def existing_session_ids(self, session_ids: Sequence[str]) -> set[str]:
+        """Return the subset of *session_ids* that already have a stored session.
+
+        One query per ``_IN_CLAUSE_BATCH`` ids instead of one
+        get_by_session_id() round trip each.
+        """
+        found: set[str] = set()
+        if not session_ids:
+            return found
+        async with aiosqlite.connect(self.db_path) as db:
+            for start in range(0, len(session_ids), _IN_CLAUSE_BATCH):
+                batch = session_ids[start : start + _IN_CLAUSE_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                cursor = await db.execute(
+                    f"SELECT session_id FROM sessions WHERE session_id IN ({placeholders})",
+                    tuple(batch),
+                )
+                found.update(row[0] for row in await cursor.fetchall())
+        return found
+
     async def list_all(self, limit: int = 50, origin: str | None = None) -> list[SessionRecord]:
         """List all sessions ordered by most recently used.
 
@@ -34,7 +34,7 @@ from .discord_ui.embeds import (
     tool_use_embed,
 )
 from .discord_ui.status import StatusManager
-from .protocols import DrainAware
+from .protocols import ActiveRunnerAware, DrainAware, IdleSignaling
 from .session_sync import CliSession, SessionMessage, extract_recent_messages, scan_cli_sessions
 from .setup import BridgeComponents, setup_bridge
 
@@ -65,7 +65,9 @@ __all__ = [
     # Scheduling
     "SchedulerCog",
     "ScheduledTaskRepository",
+    "ActiveRunnerAware",
     "DrainAware",
+    "IdleSignaling",
     "NotificationRepository",
     # Types
     "MessageType",
@@ -52,7 +52,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Tracks the state of a Claude Code session during a single run.
 
@@ -357,7 +357,9 @@ def cmd_start(env_path: Path = Path(".env")) -> None:
         print(f"❌  No .env file found at {env_path}.", file=sys.stderr)
         print("    Run 'ccdb setup' first.", file=sys.stderr)
         sys.exit(1)
-    asyncio.run(_run_start(env_path))
+    from claude_discord.utils.event_loop import run
+
+    run(_run_start(env_path))
 
 
 # ---------------------------------------------------------------------------
@@ -18,13 +18,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-import re
 from dataclasses import replace
 
 import discord
 
 from ..discord_ui.ask_handler import collect_ask_answers
-from ..discord_ui.embeds import error_embed, timeout_embed
+from ..discord_ui.embeds import error_embed
 from ..lounge import build_lounge_prompt
 from .event_processor import EventProcessor
 from .run_config import RunConfig
@@ -47,7 +46,40 @@ def configure_session_limit(max_concurrent: int) -> None:
     """
     global _global_semaphore, _max_concurrent  # noqa: PLW0603
     _max_concurrent = max_concurrent
-    _global_semaphore = asyncio.Semaphore(max_concurrent)
+    _global_semaphore = asyncio.BoundedSemaphore(max_concurrent)
+
+
+# How long a session may wait for a slot before the "waiting" notice is
+# posted.  Slots that free up quickly (e.g. a session that just finished)
+# never cost a Discord message.
+_SLOT_NOTICE_DELAY = 0.25
+
+
+async def _acquire_session_slot(
+    sem: asyncio.Semaphore, thread: discord.Thread | discord.TextChannel
+) -> None:
+    """Acquire *sem*, posting a waiting notice only if the wait is not short."""
+    if not sem.locked():
+        await sem.acquire()
+        return
+
+    acquire = asyncio.ensure_future(sem.acquire())
+    try:
+        done, _ = await asyncio.wait({acquire}, timeout=_SLOT_NOTICE_DELAY)
+        if not done:
+            with contextlib.suppress(discord.HTTPException):
+                await thread.send(
+                    f"\u23f3 Waiting for a free session slot\u2026 "
+                    f"({_max_concurrent} max sessions running)"
+                )
+            await acquire
+    except BaseException:
+        # Cancelled while waiting: give the slot back if it was already ours.
+        if acquire.done() and not acquire.cancelled() and acquire.exception() is None:
+            sem.release()
+        else:
+            acquire.cancel()
+        raise
 
 
 # Max characters for tool result display (re-exported for backward compat).
@@ -67,16 +99,6 @@ _POST_COMPACT_GUARDRAIL = (
     "These rules override any implied continuation in the compacted summary."
 )
 
-_TIMEOUT_PATTERN = re.compile(r"Timed out after (\d+) seconds")
-
-
-def _make_error_embed(error: str) -> discord.Embed:
-    """Return a timeout_embed for timeout errors, error_embed otherwise."""
-    m = _TIMEOUT_PATTERN.match(error)
-    if m:
-        return timeout_embed(int(m.group(1)))
-    return error_embed(error)
-
 
 def _truncate_result(content: str) -> str:
     """Truncate tool result content for display (re-exported for backward compat)."""
@@ -229,20 +251,20 @@ async def run_claude_with_config(config: RunConfig) -> str | None:
 
     # --- Session slot limiter (global semaphore) ---
     sem = _global_semaphore
-    if sem is not None and sem.locked():
-        with contextlib.suppress(discord.HTTPException):
-            await config.thread.send(
-                f"\u23f3 Waiting for a free session slot\u2026 "
-                f"({_max_concurrent} max sessions running)"
-            )
     if sem is not None:
-        await sem.acquire()
+        await _acquire_session_slot(sem, config.thread)
 
     try:
-        async for event in runner.run(config.prompt, session_id=config.session_id):
-            if processor.should_drain and not event.is_complete:
-                continue
-            await processor.process(event)
+        # aclosing: if this task is cancelled mid-event (e.g. bot shutdown),
+        # close the stream now so the runner's cleanup kills the CLI process
+        # instead of leaving it to async-generator garbage collection.
+        async with contextlib.aclosing(
+            runner.run(config.prompt, session_id=config.session_id)
+        ) as events:
+            async for event in events:
+                if processor.should_drain and not event.is_complete:
+                    continue
+                await processor.process(event)
     except Exception as exc:
         logger.exception("Error running Claude CLI for thread %d", config.thread.id)
         with contextlib.suppress(Exception):
@@ -13,22 +13,105 @@ Security design:
 from __future__ import annotations
 
 import asyncio
+import collections
 import contextlib
+import functools
 import logging
-from collections.abc import Callable
+import shutil
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..protocols import DrainAware
+from ..protocols import ActiveRunnerAware, DrainAware, IdleSignaling
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for each subprocess step (seconds).
 _STEP_TIMEOUT = 120
 
+# Step output posted to Discord is truncated to _OUTPUT_MAX_CHARS so the code
+# block fits in a single message.  While the step runs, output is read in
+# _READ_CHUNK_BYTES chunks and only enough trailing bytes are kept to cover
+# that many characters (UTF-8 needs at most 4 bytes per character).
+_OUTPUT_MAX_CHARS = 1800
+_OUTPUT_TAIL_BYTES = _OUTPUT_MAX_CHARS * 4
+_READ_CHUNK_BYTES = 65536
+
+# Live preview of a running step in its header message: at most one edit per
+# interval (Discord allows ~5 message edits per 5s per channel), showing the
+# last _PROGRESS_MAX_CHARS characters of output.
+_PROGRESS_INTERVAL = 2.0
+_PROGRESS_MAX_CHARS = 600
+
+# Prompt stored with sessions marked for resume across an upgrade restart.
+_UPGRADE_RESUME_PROMPT = (
+    "The bot restarted after a package upgrade. "
+    "Please report what you were working on before resuming. "
+    "⚠️ Context may have been compressed, which means the approval status of "
+    "planned tasks could be lost. "
+    "Before making any code changes, commits, or PRs, "
+    "re-confirm with the user that they want you to proceed."
+)
+
+# Reaction that grants upgrade/restart approval.
+_APPROVE_EMOJI = "✅"
+
+# Text the step header is set to once the pipeline reaches a terminal status.
+_FINAL_HEADERS = {"✅": "✅ Upgrade succeeded.", "❌": "❌ Upgrade failed."}
+
+
+def _step_banner(command: list[str]) -> str:
+    """Return the progress header shown while a step's command runs."""
+    return f"⚙️ `{' '.join(command)}`"
+
+
+async def _wait_for_events(events: list[asyncio.Event], timeout: float) -> float:
+    """Wait until every event in *events* is set or *timeout* elapses.
+
+    Returns the number of seconds waited.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with contextlib.suppress(TimeoutError, asyncio.TimeoutError):  # noqa: UP041
+        await asyncio.wait_for(asyncio.gather(*(e.wait() for e in events)), timeout)
+    return loop.time() - started
+
+
+def _decode_tail(data: bytes, max_chars: int) -> str:
+    """Decode the end of *data*, returning at most *max_chars* stripped characters.
+
+    The bytes are sliced before decoding so only the displayable tail is
+    decoded (UTF-8 needs at most 4 bytes per character).  A multi-byte
+    character split by the slice decodes to U+FFFD and is cut off by the
+    character slice.
+    """
+    text = data[-max_chars * 4 :].decode("utf-8", errors="replace").strip()
+    return text[-max_chars:]
+
+
+async def _edit_quietly(message: discord.Message, content: str) -> None:
+    """Edit *message*, ignoring HTTP errors — progress updates are best-effort."""
+    with contextlib.suppress(discord.HTTPException):
+        await message.edit(content=content)
+
+
+async def _discard_spawned(task: asyncio.Task[asyncio.subprocess.Process]) -> None:
+    """Kill and reap a pre-spawned step process that will never be run to completion."""
+    try:
+        proc = await task
+    except Exception:
+        return
+    if proc.returncode is None:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+    logger.warning(
+        "Abandoned the upgrade step after it had started; the lock file may have changed"
+    )
+
 
 class UpgradeApprovalView(discord.ui.View):
     """A Discord View with a single approval button for upgrade/restart gates.
@@ -66,11 +149,8 @@ class UpgradeApprovalView(discord.ui.View):
         self._bot_id = bot_id
         self._content = content
         self._message: discord.Message | None = None
-        # Override the default label set by the decorator
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                child.label = label
-                break
+        # View.__init__ binds the decorated button to self.approve — relabel it directly.
+        self.approve.label = label
 
     def set_message(self, message: discord.Message | None) -> None:
         """Store the message this view is attached to for use by bump()."""
@@ -119,8 +199,10 @@ class UpgradeConfig:
             Defaults to ["uv", "sync"].
         restart_command: Optional restart command
             (e.g. ["sudo", "systemctl", "restart", "my.service"]).
-        allowed_webhook_ids: Optional set of allowed webhook IDs.
-        channel_ids: Optional set of channel IDs to listen in.
+        allowed_webhook_ids: Optional set of allowed webhook IDs
+            (stored as a frozenset).
+        channel_ids: Optional set of channel IDs to listen in
+            (stored as a frozenset).
         step_timeout: Timeout in seconds for each subprocess step.
         restart_approval: If True, wait for a user to react with ✅ before
             restarting. Useful when the bot is updated from within its own
@@ -133,8 +215,8 @@ class UpgradeConfig:
     upgrade_command: list[str] | None = None
     sync_command: list[str] | None = None
     restart_command: list[str] | None = None
-    allowed_webhook_ids: set[int] | None = None
-    channel_ids: set[int] | None = None
+    allowed_webhook_ids: set[int] | frozenset[int] | None = None
+    channel_ids: set[int] | frozenset[int] | None = None
     step_timeout: int = _STEP_TIMEOUT
     restart_approval: bool = False
     upgrade_approval: bool = False
@@ -146,6 +228,13 @@ class UpgradeConfig:
     pipeline. Defaults to False so existing bots are unaffected until explicitly opted in.
     When enabled, the command respects upgrade_approval and restart_approval flags."""
 
+    def __post_init__(self) -> None:
+        # Freeze the ID sets so the frozen config can't be mutated through them.
+        for name in ("allowed_webhook_ids", "channel_ids"):
+            ids = getattr(self, name)
+            if ids is not None and not isinstance(ids, frozenset):
+                object.__setattr__(self, name, frozenset(ids))
+
 
 class AutoUpgradeCog(commands.Cog):
     """Cog that auto-upgrades a package when triggered by a Discord webhook.
@@ -168,6 +257,9 @@ class AutoUpgradeCog(commands.Cog):
         drain_timeout: Maximum seconds to wait for drain_check to return True.
             After this, the restart proceeds regardless. Default: 300s.
         drain_poll_interval: Seconds between drain_check polls. Default: 10s.
+        drain_event: Optional event that is set whenever it is safe to restart.
+            The drain awaits it instead of sleeping between polls; if
+            drain_check is also given, each wake-up is confirmed with it.
     """
 
     def __init__(
@@ -177,17 +269,48 @@ class AutoUpgradeCog(commands.Cog):
         drain_check: Callable[[], bool] | None = None,
         drain_timeout: int = 300,
         drain_poll_interval: int = 10,
+        drain_event: asyncio.Event | None = None,
     ) -> None:
         self.bot = bot
         self.config = config
         self._drain_check = drain_check
+        self._drain_event = drain_event
         self._drain_timeout = drain_timeout
         self._drain_poll_interval = drain_poll_interval
-        self._lock = asyncio.Lock()
+        # Guard against overlapping upgrades.  A plain flag suffices: it is
+        # tested and set with no await in between, so no Lock is needed.
+        self._upgrading = False
+        # UpgradeConfig is frozen, so the step commands and their banners are
+        # resolved once here rather than on every pipeline run.
+        self._upgrade_cmd = config.upgrade_command or [
+            "uv",
+            "lock",
+            "--upgrade-package",
+            config.package_name,
+        ]
+        self._sync_cmd = config.sync_command or ["uv", "sync"]
+        self._upgrade_banner = _step_banner(self._upgrade_cmd)
+        self._sync_banner = _step_banner(self._sync_cmd)
+        # Discord caps thread names at 100 characters.
+        self._thread_name = config.trigger_prefix[:100]
+        # An empty allowlist means no webhook message can ever match, so the
+        # on_message listener is not registered at all (see cog_load).
+        self._listens_for_triggers = (
+            config.allowed_webhook_ids is None or bool(config.allowed_webhook_ids)
+        ) and (config.channel_ids is None or bool(config.channel_ids))
+
+    async def cog_load(self) -> None:
+        """Register the webhook trigger listener unless no message could match."""
+        if self._listens_for_triggers:
+            self.bot.add_listener(self.on_message, "on_message")
+
+    def cog_unload(self) -> None:
+        """Remove the webhook trigger listener registered in cog_load."""
+        if self._listens_for_triggers:
+            self.bot.remove_listener(self.on_message, "on_message")
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Handle upgrade trigger messages."""
+        """Handle upgrade trigger messages (registered in cog_load)."""
         if not message.webhook_id:
             return
 
@@ -203,17 +326,24 @@ class AutoUpgradeCog(commands.Cog):
         ):
             return
 
-        if message.content.strip() != self.config.trigger_prefix:
+        # Exact match is the common hit; only allocate a stripped copy when the
+        # prefix actually occurs in the content.
+        content = message.content
+        prefix = self.config.trigger_prefix
+        if content != prefix and (prefix not in content or content.strip() != prefix):
             return
 
         logger.info("Auto-upgrade trigger received: %r", self.config.trigger_prefix)
 
-        if self._lock.locked():
+        if self._upgrading:
             await message.reply("⏳ Upgrade is already running. Skipping.")
             return
 
-        async with self._lock:
+        self._upgrading = True
+        try:
             await self._run_upgrade(message)
+        finally:
+            self._upgrading = False
 
     @app_commands.command(name="upgrade", description="Manually trigger a package upgrade")
     async def upgrade_command(self, interaction: discord.Interaction) -> None:
@@ -230,7 +360,7 @@ class AutoUpgradeCog(commands.Cog):
             )
             return
 
-        if self._lock.locked():
+        if self._upgrading:
             await interaction.response.send_message(
                 "⏳ Upgrade is already running. Please wait.",
                 ephemeral=True,
@@ -253,17 +383,19 @@ class AutoUpgradeCog(commands.Cog):
             )
             return
 
-        await interaction.response.defer()
-
-        async with self._lock:
-            thread = await text_channel.create_thread(
-                name=self.config.trigger_prefix[:100],
-            )
+        # Claim the upgrade before the first await so a second invocation
+        # arriving during defer() is rejected rather than queued.
+        self._upgrading = True
+        try:
+            await interaction.response.defer()
+            thread = await text_channel.create_thread(name=self._thread_name)
             await self._run_pipeline(thread, status_target=None)
+        finally:
+            self._upgrading = False
 
     async def _run_upgrade(self, trigger_message: discord.Message) -> None:
         """Execute the upgrade pipeline triggered by a webhook message."""
-        thread = await trigger_message.create_thread(name=self.config.trigger_prefix[:100])
+        thread = await trigger_message.create_thread(name=self._thread_name)
         await self._run_pipeline(thread, status_target=trigger_message)
 
     async def _run_pipeline(
@@ -278,6 +410,7 @@ class AutoUpgradeCog(commands.Cog):
             status_target: Message to add ✅/❌ reaction to on completion/failure.
                            None when triggered via slash command (no message to react to).
         """
+        header: discord.Message | None = None
         try:
             # Step 0: Optional upgrade approval before any subprocess runs
             if self.config.upgrade_approval:
@@ -290,62 +423,111 @@ class AutoUpgradeCog(commands.Cog):
                     ),
                 )
 
-            # Step 1: Upgrade package
-            upgrade_cmd = self.config.upgrade_command or [
-                "uv",
-                "lock",
-                "--upgrade-package",
-                self.config.package_name,
-            ]
-            ok = await self._run_step(thread, "upgrade", upgrade_cmd)
+            # Step 1: Upgrade package.  A single header message shows the
+            # current step and is edited in place, ending on the final status;
+            # each step's output is posted as a new message under its banner.  The thread already
+            # exists to report into, so the upgrade subprocess is spawned
+            # while the header round-trip is in flight.
+            upgrade_proc = asyncio.create_task(self._spawn_step(self._upgrade_cmd))
+            try:
+                header = await thread.send(self._upgrade_banner)
+            except BaseException:
+                await _discard_spawned(upgrade_proc)
+                raise
+            ok = await self._run_step(
+                thread,
+                "upgrade",
+                self._upgrade_cmd,
+                spawned=upgrade_proc,
+                header=header,
+                banner=self._upgrade_banner,
+            )
             if not ok:
-                if status_target is not None:
-                    await status_target.add_reaction("❌")
+                await self._finalize(thread, status_target, "❌", header=header)
                 return
 
             # Step 2: Sync dependencies
-            sync_cmd = self.config.sync_command or ["uv", "sync"]
-            ok = await self._run_step(thread, "sync", sync_cmd)
+            await header.edit(content=self._sync_banner)
+            ok = await self._run_step(
+                thread, "sync", self._sync_cmd, header=header, banner=self._sync_banner
+            )
             if not ok:
-                if status_target is not None:
-                    await status_target.add_reaction("❌")
+                await self._finalize(thread, status_target, "❌", header=header)
                 return
 
             # Step 3: Optional restart
-            if self.config.restart_command:
+            restart_cmd = self.config.restart_command
+            if restart_cmd:
                 if self.config.restart_approval:
                     await self._wait_for_approval(status_target, thread)
                 # Snapshot active sessions BEFORE drain so we can resume them after restart.
                 active_thread_ids = self._collect_active_thread_ids()
                 await self._drain(thread)
                 await self._mark_sessions_for_resume(active_thread_ids, thread)
-                await self._restart(status_target, thread)
+                await self._restart(status_target, thread, restart_cmd, header=header)
             else:
-                if status_target is not None:
-                    await status_target.add_reaction("✅")
-                await thread.send("✅ Upgrade complete (no restart configured).")
+                await self._finalize(
+                    thread,
+                    status_target,
+                    "✅",
+                    "✅ Upgrade complete (no restart configured).",
+                    header=header,
+                )
 
         except (TimeoutError, asyncio.TimeoutError):  # noqa: UP041 — asyncio.TimeoutError != builtins.TimeoutError on Python 3.10
-            await thread.send("❌ Step timed out.")
-            if status_target is not None:
-                await status_target.add_reaction("❌")
+            await self._finalize(thread, status_target, "❌", "❌ Step timed out.", header=header)
         except Exception:
             logger.exception("Auto-upgrade error")
-            await thread.send("❌ Upgrade failed with an unexpected error.")
-            if status_target is not None:
-                await status_target.add_reaction("❌")
+            await self._finalize(
+                thread,
+                status_target,
+                "❌",
+                "❌ Upgrade failed with an unexpected error.",
+                header=header,
+            )
+
+    async def _finalize(
+        self,
+        thread: discord.Thread,
+        status_target: discord.Message | None,
+        emoji: str,
+        text: str | None = None,
+        *,
+        header: discord.Message | None = None,
+    ) -> None:
+        """Post a terminal status line and react on *status_target* concurrently.
+
+        The thread message, the reaction and the edit of the step *header* to
+        the final status hit independent endpoints, so all requests are issued
+        together.  Failures are logged, not raised — the pipeline outcome has
+        already been decided.
+        """
+        requests = []
+        if text is not None:
+            requests.append(thread.send(text))
+        if status_target is not None:
+            requests.append(status_target.add_reaction(emoji))
+        if header is not None:
+            requests.append(header.edit(content=_FINAL_HEADERS[emoji]))
+        for result in await asyncio.gather(*requests, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to post upgrade status", exc_info=result)
 
     def _collect_active_thread_ids(self) -> frozenset[int]:
         """Return the IDs of threads with currently-running Claude sessions.
 
-        Iterates all Cogs looking for ``_active_runners`` dicts (duck-typed to
-        avoid a hard import dependency on ``ClaudeChatCog``).  Call this
+        Unions :meth:`ActiveRunnerAware.active_thread_ids` across all Cogs
+        that implement it.  Cogs that only expose an ``_active_runners`` dict
+        (the original duck-typed contract) are still discovered.  Call this
         *before* :meth:`_drain` so you capture sessions that are mid-run.
         """
         thread_ids: set[int] = set()
         for cog in self.bot.cogs.values():
             if cog is self:
                 continue
+            if isinstance(cog, ActiveRunnerAware):
+                thread_ids.update(cog.active_thread_ids())
+                continue
             active_runners = getattr(cog, "_active_runners", None)
             if isinstance(active_runners, dict):
                 thread_ids.update(active_runners.keys())
@@ -373,9 +555,8 @@ class AutoUpgradeCog(commands.Cog):
             return
 
         session_repo = getattr(self.bot, "session_repo", None)
-        marked = 0
 
-        for tid in thread_ids:
+        async def _mark_one(tid: int) -> bool:
             try:
                 session_id: str | None = None
                 if session_repo is not None:
@@ -387,44 +568,91 @@ class AutoUpgradeCog(commands.Cog):
                     tid,
                     session_id=session_id,
                     reason="bot_upgrade",
-                    resume_prompt=(
-                        "The bot restarted after a package upgrade. "
-                        "Please report what you were working on before resuming. "
-                        "⚠️ Context may have been compressed, which means the approval status of "
-                        "planned tasks could be lost. "
-                        "Before making any code changes, commits, or PRs, "
-                        "re-confirm with the user that they want you to proceed."
-                    ),
+                    resume_prompt=_UPGRADE_RESUME_PROMPT,
                 )
-                marked += 1
+                return True
             except Exception:
                 logger.warning("Failed to mark thread %d for resume", tid, exc_info=True)
+                return False
+
+        # Each mark is an independent DB round-trip — run them concurrently.
+        results = await asyncio.gather(*(_mark_one(tid) for tid in thread_ids))
+        marked = sum(results)
 
         if marked:
             await status_thread.send(
                 f"📌 {marked} active session(s) marked for auto-resume after restart."
             )
 
-    def _auto_drain_check(self) -> bool:
+    def _drain_aware_cogs(self) -> tuple[DrainAware, ...]:
+        """Return every DrainAware Cog registered on the bot, excluding this one."""
+        return tuple(
+            cog for cog in self.bot.cogs.values() if isinstance(cog, DrainAware) and cog is not self
+        )
+
+    def _auto_drain_check(self, cogs: tuple[DrainAware, ...] | None = None) -> bool:
         """Check all DrainAware Cogs registered on the bot.
 
         Returns True when every DrainAware Cog has ``active_count == 0``.
         If no DrainAware Cogs are found, returns True (safe to restart).
+
+        Args:
+            cogs: Snapshot from :meth:`_drain_aware_cogs`; discovered afresh if omitted.
         """
-        return all(
-            cog.active_count == 0
-            for cog in self.bot.cogs.values()
-            if isinstance(cog, DrainAware) and cog is not self
-        )
+        if cogs is None:
+            cogs = self._drain_aware_cogs()
+        return all(cog.active_count == 0 for cog in cogs)
+
+    async def _wait_until_idle(self, timeout: float, cogs: tuple[DrainAware, ...]) -> float:
+        """Block until every busy Cog in *cogs* signals idle, or *timeout* elapses.
+
+        Busy Cogs that satisfy :class:`IdleSignaling` are awaited directly.
+        Any busy Cog without a usable ``idle_event`` caps the wait at one
+        ``drain_poll_interval`` so it is still re-checked periodically.
+
+        Returns the number of seconds waited (0 when nothing is busy).
+        """
+        events: list[asyncio.Event] = []
+        must_poll = False
+        for cog in cogs:
+            if cog.active_count == 0:
+                continue
+            if isinstance(cog, IdleSignaling) and not cog.idle_event.is_set():
+                events.append(cog.idle_event)
+            else:
+                must_poll = True
+        if must_poll:
+            timeout = min(timeout, self._drain_poll_interval)
+
+        if events:
+            return await _wait_for_events(events, timeout)
+        if must_poll:
+            await asyncio.sleep(timeout)
+            return timeout
+        return 0.0
 
     async def _drain(self, thread: discord.Thread) -> None:
         """Wait until drain_check returns True or drain_timeout elapses.
 
-        If an explicit drain_check was provided, uses that.
-        Otherwise, auto-discovers all DrainAware Cogs on the bot.
+        With an explicit drain_event, awaits it (confirming with drain_check
+        if one was also given).  With only a drain_check, polls it every
+        ``drain_poll_interval`` seconds.  Otherwise, auto-discovers all
+        DrainAware Cogs on the bot and waits on their ``idle_event`` where
+        available, falling back to polling for Cogs that do not expose one.
         Posts status updates to the Discord thread while waiting.
         """
-        check = self._drain_check or self._auto_drain_check
+        event = self._drain_event
+        explicit = self._drain_check is not None or event is not None
+        # Discover DrainAware Cogs once per drain rather than rescanning
+        # bot.cogs on every poll.
+        cogs = () if explicit else self._drain_aware_cogs()
+        check: Callable[[], bool]
+        if self._drain_check is not None:
+            check = self._drain_check
+        elif event is not None:
+            check = event.is_set
+        else:
+            check = functools.partial(self._auto_drain_check, cogs)
         if check():
             return
 
@@ -432,12 +660,21 @@ class AutoUpgradeCog(commands.Cog):
             f"⏳ Upgrade ready — waiting for active sessions to finish "
             f"(max {self._drain_timeout}s)..."
         )
-        elapsed = 0
+        elapsed: float = 0
         while elapsed < self._drain_timeout:
-            await asyncio.sleep(self._drain_poll_interval)
-            elapsed += self._drain_poll_interval
+            remaining = self._drain_timeout - elapsed
+            if event is not None and not event.is_set():
+                if self._drain_check is not None:
+                    # The event only hints; re-check drain_check at least every poll.
+                    remaining = min(remaining, self._drain_poll_interval)
+                elapsed += await _wait_for_events([event], remaining)
+            elif not explicit:
+                elapsed += await self._wait_until_idle(remaining, cogs)
+            else:
+                await asyncio.sleep(self._drain_poll_interval)
+                elapsed += self._drain_poll_interval
             if check():
-                await thread.send(f"✅ Sessions finished ({elapsed}s). Restarting now...")
+                await thread.send(f"✅ Sessions finished ({elapsed:.0f}s). Restarting now...")
                 return
 
         await thread.send(f"⚠️ Drain timeout ({self._drain_timeout}s elapsed) — restarting anyway.")
@@ -466,8 +703,9 @@ class AutoUpgradeCog(commands.Cog):
         approval_msg = await thread.send(text)
         await approval_msg.add_reaction("✅")
 
-        # Shared event — set by either the reaction loop or the button callback.
+        # Shared event — set by either the reaction listener or the button callback.
         approved = asyncio.Event()
+        bot_id = self.bot.user.id if self.bot.user else None
 
         # Post a button in the parent channel so approval is always one click
         # away at the bottom of the channel (no need to scroll up to the thread).
@@ -475,7 +713,6 @@ class AutoUpgradeCog(commands.Cog):
         view: UpgradeApprovalView | None = None
         parent = getattr(thread, "parent", None)
         if parent is not None:
-            bot_id = self.bot.user.id if self.bot.user else None
             msg_content = (
                 f"🔔 **Approval needed** — {text}\n"
                 "(React ✅ in the upgrade thread above, or click here ↓)"
@@ -488,51 +725,35 @@ class AutoUpgradeCog(commands.Cog):
                 logger.debug("Could not post approval button to parent channel", exc_info=True)
                 view = None
 
-        # Task 1: watch for the ✅ reaction on the thread message.
-        async def _watch_reaction() -> None:
+        # One listener, registered for the whole wait, sets the same event as
+        # the button — so a single loop covers both approval paths and the
+        # reminders.  Test the cheapest discriminator (message ID) first.
+        approval_msg_id = approval_msg.id
+
+        async def _on_raw_reaction_add(e: discord.RawReactionActionEvent) -> None:
+            if (
+                e.message_id == approval_msg_id
+                and e.user_id != bot_id
+                and str(e.emoji) == _APPROVE_EMOJI
+            ):
+                logger.info("Restart approved by user %s", e.user_id)
+                approved.set()
+
+        self.bot.add_listener(_on_raw_reaction_add, "on_raw_reaction_add")
+        try:
             while not approved.is_set():
                 try:
-                    event = await self.bot.wait_for(
-                        "raw_reaction_add",
-                        check=lambda e: (
-                            e.message_id == approval_msg.id
-                            and str(e.emoji) == "✅"
-                            and (self.bot.user is None or e.user_id != self.bot.user.id)
-                        ),
-                        timeout=float(self._drain_timeout),
-                    )
-                    logger.info("Restart approved by user %s", event.user_id)
-                    approved.set()
+                    await asyncio.wait_for(approved.wait(), timeout=float(self._drain_timeout))
                 except (TimeoutError, asyncio.TimeoutError):  # noqa: UP041
-                    if not approved.is_set():
-                        await thread.send(
-                            "⏳ Still waiting for restart approval... "
-                            "React ✅ above or click the button in the channel."
-                        )
-                        # Re-post the button at the bottom so it stays visible.
-                        if view is not None and parent is not None:
-                            await view.bump(parent)
-
-        # Task 2: resolve as soon as the button (or reaction) sets the event.
-        async def _watch_button() -> None:
-            await approved.wait()
-
-        reaction_task = asyncio.create_task(_watch_reaction())
-        button_task = asyncio.create_task(_watch_button())
-
-        done, pending = await asyncio.wait(
-            {reaction_task, button_task},
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-
-        for task in pending:
-            task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await task
-
-        # Propagate unexpected exceptions from finished tasks.
-        for task in done:
-            task.result()
+                    await thread.send(
+                        "⏳ Still waiting for restart approval... "
+                        "React ✅ above or click the button in the channel."
+                    )
+                    # Re-post the button at the bottom so it stays visible.
+                    if view is not None and parent is not None:
+                        await view.bump(parent)
+        finally:
+            self.bot.remove_listener(_on_raw_reaction_add, "on_raw_reaction_add")
 
         # Remove the channel button — it's no longer needed.
         # view._message tracks the latest button post (may have been bumped).
@@ -547,55 +768,137 @@ class AutoUpgradeCog(commands.Cog):
         self,
         status_target: discord.Message | None,
         thread: discord.Thread,
+        restart_cmd: list[str],
+        *,
+        header: discord.Message | None = None,
     ) -> None:
         """Execute the restart command (fire-and-forget).
 
-        Uses create_subprocess_exec (not shell=True) — all args are from
-        UpgradeConfig, not user input. Safe by construction.
+        Uses create_subprocess_exec (not shell=True) — *restart_cmd* comes from
+        ``UpgradeConfig.restart_command``, not user input. Safe by construction.
+
+        The restart fires while the bot is near its peak RSS, so the spawn is
+        set up to take CPython's ``posix_spawn`` fast path (vfork-style, no
+        page-table copy) instead of fork+exec: the executable is resolved to a
+        path up front, no ``cwd`` is set, and ``close_fds=False`` — safe since
+        Python opens every descriptor non-inheritable (PEP 446).
         """
-        await thread.send("🔄 Restarting...")
-        if status_target is not None:
-            await status_target.add_reaction("✅")
-        await asyncio.sleep(1)
-        assert self.config.restart_command is not None  # Caller checks this
+        # _finalize returns only after Discord has acknowledged both requests,
+        # so the notice is already delivered — no settle delay is needed.
+        await self._finalize(thread, status_target, "✅", "🔄 Restarting...", header=header)
         await asyncio.create_subprocess_exec(
-            *self.config.restart_command,
+            *restart_cmd,
+            executable=shutil.which(restart_cmd[0]),
+            close_fds=False,
             stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.DEVNULL,
         )
 
+    async def _spawn_step(self, command: list[str]) -> asyncio.subprocess.Process:
+        """Start *command* in the working directory with stdout+stderr piped.
+
+        Setting ``cwd`` rules out the ``posix_spawn`` fast path, so steps use
+        fork+exec; see :meth:`_restart` for the one spawn where that matters.
+        """
+        return await asyncio.create_subprocess_exec(
+            *command,
+            cwd=self.config.working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
     async def _run_step(
         self,
         thread: discord.Thread,
         step_name: str,
         command: list[str],
+        *,
+        spawned: Awaitable[asyncio.subprocess.Process] | None = None,
+        header: discord.Message | None = None,
+        banner: str = "",
     ) -> bool:
-        """Run a single subprocess step, posting output to the thread.
+        """Run a single subprocess step, posting its output to the thread.
 
         All command args come from UpgradeConfig (server-side config),
         not from user/webhook input. Uses create_subprocess_exec for safety.
+        The step header is managed by :meth:`_run_pipeline`.
+
+        Args:
+            spawned: Process for *command* that was already started; spawned here
+                if omitted.
+            header: Step header message.  While a long step runs, it is edited
+                at most every ``_PROGRESS_INTERVAL`` seconds to show *banner*
+                plus the latest output, then restored to *banner*.
+            banner: Header text for this step.
 
         Returns True on success, False on failure.
         """
-        cmd_str = " ".join(command)
-        await thread.send(f"⚙️ `{cmd_str}`")
+        proc = await (spawned if spawned is not None else self._spawn_step(command))
+        loop = asyncio.get_running_loop()
+        last_progress = loop.time()
+        progress_task: asyncio.Task[None] | None = None
+
+        # Keep only the trailing chunks while the process runs so memory stays
+        # bounded no matter how verbose the step is.  Fixed-size reads also
+        # cope with arbitrarily long lines (readline() caps at 64 KiB).
+        tail: collections.deque[bytes] = collections.deque()
+        tail_bytes = 0
+
+        async def _pump() -> None:
+            nonlocal tail_bytes, last_progress, progress_task
+            assert proc.stdout is not None  # stdout=PIPE above
+            while chunk := await proc.stdout.read(_READ_CHUNK_BYTES):
+                tail.append(chunk)
+                tail_bytes += len(chunk)
+                # Drop whole chunks while the remainder still covers the cap.
+                while tail_bytes - len(tail[0]) >= _OUTPUT_TAIL_BYTES:
+                    tail_bytes -= len(tail.popleft())
+                # Throttled live preview, driven by new output so an idle step
+                # costs nothing.  The edit runs in the background so reading
+                # never waits on Discord.
+                now = loop.time()
+                if (
+                    header is not None
+                    and now - last_progress >= _PROGRESS_INTERVAL
+                    and (progress_task is None or progress_task.done())
+                ):
+                    last_progress = now
+                    snippet = _decode_tail(b"".join(tail), _PROGRESS_MAX_CHARS)
+                    progress_task = asyncio.create_task(
+                        _edit_quietly(header, f"{banner}\n```\n{snippet}\n```")
+                    )
 
-        proc = await asyncio.create_subprocess_exec(
-            *command,
-            cwd=self.config.working_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(_pump(), proc.wait()), timeout=self.config.step_timeout
+            )
+        finally:
+            # On timeout or cancellation, don't leave the child
+            # (e.g. a half-finished ``uv sync``) running after the step is abandoned.
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+            if progress_task is not None and header is not None:
+                # The full tail is posted below; put the header back to the banner.
+                await progress_task
+                await _edit_quietly(header, banner)
+
+        # Output and failure notice go out as one message, labelled with the
+        # step banner; the output cap leaves room for the banner and notice
+        # within Discord's 2000-character limit.
+        output = _decode_tail(
+            b"".join(tail), max(_OUTPUT_MAX_CHARS - len(banner), _PROGRESS_MAX_CHARS)
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=self.config.step_timeout)
-        output = stdout.decode("utf-8", errors="replace").strip()
-
+        parts: list[str] = []
         if output:
-            # Truncate to fit Discord message limit
-            truncated = output[:1800]
-            await thread.send(f"```\n{truncated}\n```")
-
+            # Show the end of the log (where errors land), truncated to fit Discord
+            parts.append(f"```\n{output}\n```")
         if proc.returncode != 0:
-            await thread.send(f"❌ `{step_name}` failed (exit code {proc.returncode}).")
-            return False
+            parts.append(f"❌ `{step_name}` failed (exit code {proc.returncode}).")
+        if parts:
+            if banner:
+                parts.insert(0, banner)
+            await thread.send("\n".join(parts))
 
-        return True
+        return proc.returncode == 0
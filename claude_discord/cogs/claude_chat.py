@@ -11,11 +11,10 @@ Handles the core message flow:
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
 import os
 import tempfile
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import discord
 from discord import app_commands
@@ -31,7 +30,7 @@ from ..concurrency import SessionRegistry
 from ..database.ask_repo import PendingAskRepository
 from ..database.lounge_repo import LoungeRepository
 from ..database.repository import SessionRepository
-from ..database.resume_repo import PendingResumeRepository
+from ..database.resume_repo import PendingResume, PendingResumeRepository
 from ..database.settings_repo import SettingsRepository
 from ..discord_ui.embeds import stopped_embed
 from ..discord_ui.status import StatusManager
@@ -89,6 +88,26 @@ _HELP_CATEGORY: dict[str, str | None] = {
 # Section display order in the embed.
 _HELP_SECTION_ORDER: list[str] = ["📌 Session", "🤖 Model", "⚡ Effort", "🔧 Advanced"]
 
+# Seconds _handle_thread_reply waits for an interrupted session to wind down,
+# once before killing its runner and once more after.
+_HANDOVER_TIMEOUT = 5.0
+
+# Pending resumes on_ready processes at the same time.
+_RESUME_CONCURRENCY = 4
+
+# Prompt for sessions resumed after a restart: stored by cog_unload, and the
+# fallback for pending rows that carry no prompt of their own.
+_RESUME_PROMPT = (
+    "The bot restarted. "
+    "Please report what you were working on before resuming. "
+    "⚠️ Context may have been compressed, which means the approval status of "
+    "planned tasks could be lost. "
+    "Before making any code changes, commits, or PRs, "
+    "re-confirm with the user that they want you to proceed."
+)
+# Prefix of the seed message posted into a resumed thread.
+_RESUME_HEADER = "🔄 **Bot restarted.**\n"
+
 
 class ClaudeChatCog(commands.Cog):
     """Cog that handles Claude Code conversations via Discord threads."""
@@ -143,6 +162,10 @@ class ClaudeChatCog(commands.Cog):
         self._chat_only_channel_ids: set[int] = chat_only_channel_ids or set()
         self._registry = registry or getattr(bot, "session_registry", None)
         self._active_runners: dict[int, SessionBackend] = {}
+        # Set while _active_runners is empty; lets AutoUpgradeCog await the
+        # drain instead of polling active_count.
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
         # Tracks the asyncio.Task running _run_claude for each thread.
         # Used by _handle_thread_reply to wait for an interrupted session
         # to fully clean up before starting the replacement session.
@@ -171,6 +194,15 @@ class ClaudeChatCog(commands.Cog):
         """Alias for active_session_count (satisfies DrainAware protocol)."""
         return self.active_session_count
 
+    @property
+    def idle_event(self) -> asyncio.Event:
+        """Set while no session is running (satisfies IdleSignaling protocol)."""
+        return self._idle_event
+
+    def active_thread_ids(self) -> frozenset[int]:
+        """Thread IDs with a running session (satisfies ActiveRunnerAware protocol)."""
+        return frozenset(self._active_runners)
+
     def _get_dashboard(self) -> ThreadStatusDashboard | None:
         """Return the dashboard, resolving it from the bot if not yet set."""
         if self._dashboard is None:
@@ -217,6 +249,18 @@ class ClaudeChatCog(commands.Cog):
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         """Handle incoming messages."""
+        # Channel routing first: on a busy server most messages arrive in
+        # channels this cog does not watch, so reject those before the
+        # author/type/permission checks below.
+        channel = message.channel
+        watched = self._channel_ids
+        is_target_channel = channel.id in watched
+        # Only threads carry a parent_id, so this doubles as the Thread check
+        # without an isinstance() on every message.
+        is_target_thread = getattr(channel, "parent_id", None) in watched
+        if not (is_target_channel or is_target_thread or self._monitor_all_channels):
+            return
+
         # Ignore bot messages
         if message.author.bot:
             return
@@ -232,22 +276,15 @@ class ClaudeChatCog(commands.Cog):
         if self._allowed_user_ids is not None and message.author.id not in self._allowed_user_ids:
             return
 
-        # Determine whether this channel/thread is a valid target.
         # When monitor_all_channels is True, accept any guild text/forum channel.
-        is_target_channel = message.channel.id in self._channel_ids
-        is_target_thread = (
-            isinstance(message.channel, discord.Thread)
-            and message.channel.parent_id in self._channel_ids
-        )
-
         if (
             self._monitor_all_channels
             and not is_target_channel
             and not is_target_thread
-            and hasattr(message.channel, "guild")
-            and message.channel.guild is not None
+            and hasattr(channel, "guild")
+            and channel.guild is not None
         ):
-            if isinstance(message.channel, discord.Thread):
+            if isinstance(channel, discord.Thread):
                 is_target_thread = True
             else:
                 is_target_channel = True
@@ -510,11 +547,11 @@ class ClaudeChatCog(commands.Cog):
             )
             return
 
-        # Kill active runner if any
-        runner = self._active_runners.get(interaction.channel.id)
+        # Kill active runner if any.  Pop first: while kill() waits for the
+        # process, _run_claude's cleanup may release the entry itself.
+        runner = self._active_runners.pop(interaction.channel.id, None)
         if runner:
             await runner.kill()
-            del self._active_runners[interaction.channel.id]
 
         deleted = await self.repo.delete(interaction.channel.id)
         if deleted:
@@ -784,14 +821,7 @@ class ClaudeChatCog(commands.Cog):
                     thread_id,
                     session_id=session_id,
                     reason="bot_shutdown",
-                    resume_prompt=(
-                        "The bot restarted. "
-                        "Please report what you were working on before resuming. "
-                        "⚠️ Context may have been compressed, which means the approval status of "
-                        "planned tasks could be lost. "
-                        "Before making any code changes, commits, or PRs, "
-                        "re-confirm with the user that they want you to proceed."
-                    ),
+                    resume_prompt=_RESUME_PROMPT,
                 )
                 logger.info(
                     "Marked thread %d for restart-resume (session=%s)", thread_id, session_id
@@ -817,70 +847,82 @@ class ClaudeChatCog(commands.Cog):
         - A resume failure (e.g. channel not found) is logged and skipped
           gracefully — it never prevents the bot from becoming ready.
         """
-        if self._resume_repo is None:
+        resume_repo = self._resume_repo
+        if resume_repo is None:
             return
 
-        pending = await self._resume_repo.get_pending()
+        pending = await resume_repo.get_pending()
         if not pending:
             return
 
         logger.info("Found %d pending session resume(s) on startup", len(pending))
 
-        for entry in pending:
-            # Delete FIRST — prevents double-resume even if spawn fails
-            await self._resume_repo.delete(entry.id)
-
-            thread_id = entry.thread_id
-            try:
-                raw = self.bot.get_channel(thread_id)
-                if raw is None:
-                    raw = await self.bot.fetch_channel(thread_id)
-            except Exception:
-                logger.warning(
-                    "Pending resume: thread %d not found, skipping", thread_id, exc_info=True
+        # Each resume is a few Discord round trips (fetch channel, post the
+        # seed message); run them side by side, capped to stay polite.
+        sem = asyncio.Semaphore(_RESUME_CONCURRENCY)
+
+        async def _bounded(entry: PendingResume) -> None:
+            async with sem:
+                await self._resume_one(resume_repo, entry)
+
+        results = await asyncio.gather(*(_bounded(e) for e in pending), return_exceptions=True)
+        for entry, result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Pending resume for thread %d failed",
+                    entry.thread_id,
+                    exc_info=result,
                 )
-                continue
 
-            if not isinstance(raw, discord.Thread):
-                logger.warning("Pending resume: channel %d is not a Thread, skipping", thread_id)
-                continue
+    async def _resume_one(self, resume_repo: PendingResumeRepository, entry: PendingResume) -> None:
+        """Resume a single pending session (see on_ready)."""
+        # Delete FIRST — prevents double-resume even if spawn fails
+        await resume_repo.delete(entry.id)
 
-            thread = raw
-            parent = thread.parent
-            if not isinstance(parent, discord.TextChannel):
-                logger.warning(
-                    "Pending resume: thread %d has no TextChannel parent, skipping", thread_id
-                )
-                continue
-
-            resume_prompt = entry.resume_prompt or (
-                "The bot restarted. "
-                "Please report what you were working on before resuming. "
-                "⚠️ Context may have been compressed, which means the approval status of "
-                "planned tasks could be lost. "
-                "Before making any code changes, commits, or PRs, "
-                "re-confirm with the user that they want you to proceed."
+        thread_id = entry.thread_id
+        try:
+            raw = self.bot.get_channel(thread_id)
+            if raw is None:
+                raw = await self.bot.fetch_channel(thread_id)
+        except Exception:
+            logger.warning(
+                "Pending resume: thread %d not found, skipping", thread_id, exc_info=True
             )
+            return
+
+        if not isinstance(raw, discord.Thread):
+            logger.warning("Pending resume: channel %d is not a Thread, skipping", thread_id)
+            return
 
-            logger.info(
-                "Resuming session in thread %d (session_id=%s, reason=%s)",
-                thread_id,
-                entry.session_id,
-                entry.reason,
+        thread = raw
+        parent = thread.parent
+        if not isinstance(parent, discord.TextChannel):
+            logger.warning(
+                "Pending resume: thread %d has no TextChannel parent, skipping", thread_id
             )
-            try:
-                # Post directly into the existing thread — no new thread needed
-                seed_message = await thread.send(f"🔄 **Bot restarted.**\n{resume_prompt}")
-                asyncio.create_task(
-                    self._run_claude(
-                        seed_message,
-                        thread,
-                        resume_prompt,
-                        session_id=entry.session_id,
-                    )
+            return
+
+        resume_prompt = entry.resume_prompt or _RESUME_PROMPT
+
+        logger.info(
+            "Resuming session in thread %d (session_id=%s, reason=%s)",
+            thread_id,
+            entry.session_id,
+            entry.reason,
+        )
+        try:
+            # Post directly into the existing thread — no new thread needed
+            seed_message = await thread.send(_RESUME_HEADER + resume_prompt)
+            asyncio.create_task(
+                self._run_claude(
+                    seed_message,
+                    thread,
+                    resume_prompt,
+                    session_id=entry.session_id,
                 )
-            except Exception:
-                logger.error("Failed to resume session in thread %d", thread_id, exc_info=True)
+            )
+        except Exception:
+            logger.error("Failed to resume session in thread %d", thread_id, exc_info=True)
 
     async def _handle_thread_reply(self, message: discord.Message) -> None:
         """Continue a Claude Code session in an existing thread.
@@ -890,12 +932,15 @@ class ClaudeChatCog(commands.Cog):
         finish cleaning up before starting the new session.  This prevents two
         Claude processes from running in parallel in the same thread.
         """
-        thread = message.channel
-        assert isinstance(thread, discord.Thread)
+        # on_message only routes threads here: either the channel has a watched
+        # parent_id, or monitor_all_channels classified it with isinstance().
+        thread = cast(discord.Thread, message.channel)
 
-        record = await self.repo.get(thread.id)
+        # The session lookup and the attachment downloads are independent.
+        record, (prompt, images) = await asyncio.gather(
+            self.repo.get(thread.id), self._build_prompt_and_images(message)
+        )
         session_id = record.session_id if record else None
-        prompt, images = await self._build_prompt_and_images(message)
 
         # When there is no session record, this is the first human reply in a
         # thread created via /api/spawn with auto_start=false.  The seed
@@ -932,9 +977,8 @@ class ClaudeChatCog(commands.Cog):
             if existing_runner is not None:
                 await thread.send("-# ⚡ Interrupted. Starting with new instruction...")
                 await existing_runner.interrupt()
-                if existing_task is not None and not existing_task.done():
-                    with contextlib.suppress(Exception):
-                        await existing_task
+                if existing_task is not None:
+                    await self._await_handover(thread.id, existing_runner, existing_task)
 
         # Determine chat_only from the parent channel of this thread.
         chat_only = (thread.parent_id or 0) in self._chat_only_channel_ids
@@ -948,6 +992,26 @@ class ClaudeChatCog(commands.Cog):
             chat_only=chat_only,
         )
 
+    @staticmethod
+    async def _await_handover(thread_id: int, runner: SessionBackend, task: asyncio.Task) -> None:
+        """Wait, bounded, for an interrupted session's task to finish cleaning up.
+
+        If the task is still running after ``_HANDOVER_TIMEOUT`` the runner is
+        killed and the task gets one more grace period; after that the new
+        session starts regardless so a stuck cleanup can't block the thread.
+        The task's own outcome is not re-raised here.
+        """
+        _, pending = await asyncio.wait({task}, timeout=_HANDOVER_TIMEOUT)
+        if not pending:
+            return
+        logger.warning("Interrupted session in thread %d still running, killing", thread_id)
+        await runner.kill()
+        _, pending = await asyncio.wait({task}, timeout=_HANDOVER_TIMEOUT)
+        if pending:
+            logger.warning(
+                "Interrupted session in thread %d did not finish; starting anyway", thread_id
+            )
+
     async def _build_prompt_and_images(
         self, message: discord.Message
     ) -> tuple[str, list[ImageData]]:
@@ -986,6 +1050,24 @@ class ClaudeChatCog(commands.Cog):
             logger.debug("Failed to fetch seed message for thread %d", thread.id, exc_info=True)
             return None
 
+    def _release_session(
+        self, thread_id: int, runner: SessionBackend, task: asyncio.Task | None
+    ) -> None:
+        """Forget a finished session's runner and task, and signal idle if none remain.
+
+        Entries are only removed while they still belong to this session, so a
+        late cleanup can't drop a newer session started in the same thread.
+        Safe to call more than once.
+        """
+        if self._active_runners.get(thread_id) is runner:
+            del self._active_runners[thread_id]
+        if task is not None and self._active_tasks.get(thread_id) is task:
+            del self._active_tasks[thread_id]
+        # /clear and /rewind may have dropped other entries already, so
+        # test for emptiness rather than counting.
+        if not self._active_runners:
+            self._idle_event.set()
+
     async def _run_claude(
         self,
         user_message: discord.Message,
@@ -1045,6 +1127,13 @@ class ClaudeChatCog(commands.Cog):
             effort_override=effort_override,
         )
         self._active_runners[thread.id] = runner
+        self._idle_event.clear()
+        if current_task is not None:
+            # Backstop for the finally block below: if the task is cancelled
+            # again while cleaning up, the bookkeeping is still released.
+            current_task.add_done_callback(
+                lambda task: self._release_session(thread.id, runner, task)
+            )
 
         # In chat_only mode, skip the "Session running" message and stop button.
         stop_view: StopView | None = None
@@ -1076,17 +1165,43 @@ class ClaudeChatCog(commands.Cog):
                 )
             )
         finally:
-            if stop_view is not None:
-                await stop_view.disable()
-            self._active_runners.pop(thread.id, None)
-            self._active_tasks.pop(thread.id, None)
-            self._thread_locks.pop(thread.id, None)
-
-            # Transition to WAITING_INPUT so owner knows a reply is needed
-            if dashboard is not None:
-                await dashboard.set_state(
-                    thread.id,
-                    ThreadState.WAITING_INPUT,
-                    description,
-                    thread=thread,
+            # Shielded: a second cancel (e.g. shutdown) arriving mid-cleanup
+            # must not leave the stop button live or the dashboard stale.
+            await asyncio.shield(
+                self._finish_session(
+                    thread, runner, current_task, stop_view, dashboard, description
                 )
+            )
+
+    async def _finish_session(
+        self,
+        thread: discord.Thread | discord.TextChannel,
+        runner: SessionBackend,
+        task: asyncio.Task | None,
+        stop_view: StopView | None,
+        dashboard: ThreadStatusDashboard | None,
+        description: str,
+    ) -> None:
+        """Post-run cleanup for _run_claude: stop button, bookkeeping, dashboard.
+
+        A session whose handover timed out can finish after a newer session
+        has taken over the thread; the thread lock and dashboard then belong
+        to the newer session and are left alone.
+        """
+        if stop_view is not None:
+            await stop_view.disable()
+        current = self._active_runners.get(thread.id)
+        superseded = current is not None and current is not runner
+        self._release_session(thread.id, runner, task)
+        if superseded:
+            return
+        self._thread_locks.pop(thread.id, None)
+
+        # Transition to WAITING_INPUT so owner knows a reply is needed
+        if dashboard is not None:
+            await dashboard.set_state(
+                thread.id,
+                ThreadState.WAITING_INPUT,
+                description,
+                thread=thread,
+            )
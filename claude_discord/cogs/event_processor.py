@@ -10,8 +10,11 @@ so that individual event handlers can be tested in isolation.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
+import re
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 import discord
@@ -21,11 +24,14 @@ from ..discord_ui.chunker import _wrap_tables_in_fences, chunk_message
 from ..discord_ui.elicitation_view import ElicitationFormView, ElicitationUrlView
 from ..discord_ui.embeds import (
     elicitation_embed,
+    error_embed,
     permission_embed,
     plan_embed,
     redacted_thinking_embed,
+    session_complete_embed,
     session_start_embed,
     thinking_embed,
+    timeout_embed,
     todo_embed,
     tool_result_embed,
     tool_result_preview_embed,
@@ -104,6 +110,17 @@ _TOOL_RESULT_MAX_CHARS = 3000
 _COLLAPSED_LINES = 1
 
 
+_TIMEOUT_PATTERN = re.compile(r"Timed out after (\d+) seconds")
+
+
+def _make_error_embed(error: str) -> discord.Embed:
+    """Return a timeout_embed for timeout errors, error_embed otherwise."""
+    m = _TIMEOUT_PATTERN.match(error)
+    if m:
+        return timeout_embed(int(m.group(1)))
+    return error_embed(error)
+
+
 def _truncate_result(content: str) -> str:
     """Truncate tool result content for display."""
     if len(content) <= _TOOL_RESULT_MAX_CHARS:
@@ -111,6 +128,18 @@ def _truncate_result(content: str) -> str:
     return content[:_TOOL_RESULT_MAX_CHARS] + "\n... (truncated)"
 
 
+# Responses longer than this are chunked in a worker thread so table
+# wrapping and boundary scanning don't stall other sessions' events.
+_THREADED_CHUNK_CHARS = 4096
+
+
+async def _chunk_text(text: str) -> list[str]:
+    """Split *text* for Discord, off the event loop when it is long."""
+    if len(text) > _THREADED_CHUNK_CHARS:
+        return await asyncio.to_thread(chunk_message, text)
+    return chunk_message(text)
+
+
 class EventProcessor:
     """Processes stream-json events and dispatches Discord actions.
 
@@ -156,6 +185,10 @@ class EventProcessor:
         # (skip events) then handle the ask after the stream ends.
         self._pending_ask: list[AskQuestion] | None = None
 
+        # Session id last written by _on_system, so repeated SYSTEM events
+        # with the same id skip the redundant repo.save().
+        self._saved_session_id: str | None = None
+
         # Set when compact_boundary fires (and post_compact_rerun is False).
         # Triggers interrupt → rerun-with-guardrail in _run_helper.
         self._compact_occurred: bool = False
@@ -169,6 +202,15 @@ class EventProcessor:
         self._last_turn_cache_read_tokens: int | None = None
         self._last_turn_cache_creation_tokens: int | None = None
 
+        # One lookup per event instead of an if/elif chain over message types.
+        self._handlers: dict[MessageType, Callable[[StreamEvent], Awaitable[None]]] = {
+            MessageType.SYSTEM: self._on_system,
+            MessageType.ASSISTANT: self._on_assistant,
+            MessageType.USER: self._on_tool_result,
+            MessageType.PROGRESS: self._on_progress,
+            MessageType.RATE_LIMIT_EVENT: self._on_rate_limit_event,
+        }
+
     # ------------------------------------------------------------------
     # Public properties
     # ------------------------------------------------------------------
@@ -204,27 +246,22 @@ class EventProcessor:
 
     async def process(self, event: StreamEvent) -> None:
         """Dispatch a single stream event to the appropriate handler."""
-        if event.message_type == MessageType.SYSTEM:
-            await self._on_system(event)
-        elif event.message_type == MessageType.ASSISTANT:
-            await self._on_assistant(event)
-        elif event.message_type == MessageType.USER:
-            await self._on_tool_result(event)
-        elif event.message_type == MessageType.PROGRESS:
-            await self._on_progress(event)
-
-        elif event.message_type == MessageType.RATE_LIMIT_EVENT:
-            await self._on_rate_limit_event(event)
+        handler = self._handlers.get(event.message_type)
+        if handler is not None:
+            await handler(event)
 
         if event.is_complete:
             await self._on_complete(event)
 
     async def finalize(self) -> None:
-        """Cancel any running timers. Call in a finally block."""
-        for task in self._state.active_timers.values():
-            if not task.done():
-                task.cancel()
+        """Cancel any running timers and wait for them to stop. Call in a finally block."""
+        timers = [task for task in self._state.active_timers.values() if not task.done()]
         self._state.active_timers.clear()
+        for task in timers:
+            task.cancel()
+        # Wait for all of them at once so no stale "running" edit lands after
+        # the caller has moved on.
+        await asyncio.gather(*timers, return_exceptions=True)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -270,7 +307,10 @@ class EventProcessor:
             return
 
         self._state.session_id = event.session_id
-        if self._config.repo:
+        # Claude emits several SYSTEM events per run carrying the same id;
+        # only the first one needs to reach the database.
+        if self._config.repo and event.session_id != self._saved_session_id:
+            self._saved_session_id = event.session_id
             wd = getattr(self._config.runner, "working_dir", None)
             # For new sessions, save the prompt as the summary so /resume can display it.
             # For resumed sessions (config.session_id is set), pass no summary to keep
@@ -409,14 +449,6 @@ class EventProcessor:
 
     async def _on_complete(self, event: StreamEvent) -> None:
         """Handle RESULT events — finalize streaming, post summary embed."""
-        import asyncio
-
-        from ..discord_ui.embeds import (
-            session_complete_embed,
-        )
-        from ..discord_ui.streaming_manager import StreamingMessageManager
-        from ._run_helper import _make_error_embed
-
         # Prefer per-turn usage (last assistant message) over cumulative RESULT usage.
         # The RESULT sums tokens across ALL API calls, inflating context utilization.
         if self._last_turn_input_tokens is not None:
@@ -446,7 +478,7 @@ class EventProcessor:
             response_text = event.text
             if response_text and not self._assistant_text_sent:
                 last_sent: discord.Message | None = None
-                for chunk in chunk_message(response_text):
+                for chunk in await _chunk_text(response_text):
                     last_sent = await self._config.thread.send(chunk)
                 if last_sent is not None:
                     last_assistant_url = last_sent.jump_url
@@ -559,7 +591,7 @@ class EventProcessor:
                 self._streamer = StreamingMessageManager(self._config.thread)
             else:
                 # No partial events arrived — post the full text directly.
-                for chunk in chunk_message(event.text):
+                for chunk in await _chunk_text(event.text):
                     await self._config.thread.send(chunk)
             self._state.partial_text = ""
             self._state.accumulated_text = event.text
@@ -7,10 +7,13 @@ Cog or Bot state.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 import os
 import os.path
+import weakref
+from typing import Literal
 
 import discord
 
@@ -26,6 +29,10 @@ ALLOWED_MIME_PREFIXES = (
 )
 IMAGE_MIME_PREFIXES = ("image/",)
 
+# How build_prompt_and_images handles an attachment: base64 image block,
+# inline text, or (with save_dir) a file saved to disk only.
+_AttachmentKind = Literal["image", "text", "file"]
+
 # File extensions treated as text when content_type is absent.
 # Discord converts long pasted text to "message.txt" without a content_type.
 _TEXT_EXTENSIONS: frozenset[str] = frozenset(
@@ -94,6 +101,15 @@ MAX_TOTAL_BYTES = 500_000  # 500 KB across all text attachments
 MAX_ATTACHMENTS = 5
 MAX_IMAGES = 4  # Claude supports up to 4 images per prompt
 
+# Process-wide cap on concurrent Discord CDN downloads.  Each message fetches
+# its attachments in parallel; the cap keeps bursts across many busy threads
+# from tripping CDN rate limits.  One semaphore per event loop, created on
+# first use, since an asyncio.Semaphore binds to the loop that first waits on it.
+MAX_CONCURRENT_READS = 8
+_read_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
 # Media types accepted by the Anthropic API for base64 image blocks.
 _SUPPORTED_MEDIA_TYPES: frozenset[str] = frozenset(
     {"image/jpeg", "image/png", "image/gif", "image/webp"}
@@ -185,6 +201,16 @@ def _convert_image_if_needed(raw: bytes, media_type: str) -> tuple[bytes, str]:
         return raw, "image/png"
 
 
+def _encode_image(raw: bytes, media_type: str) -> tuple[bytes, str, str]:
+    """Convert *raw* to an API-supported format if needed and base64-encode it.
+
+    Returns:
+        (image_bytes, media_type, base64_text) — blocking; run in a worker thread.
+    """
+    raw, media_type = _convert_image_if_needed(raw, media_type)
+    return raw, media_type, base64.standard_b64encode(raw).decode("ascii")
+
+
 # Keywords that indicate the user wants a file sent/attached.
 _SEND_FILE_KEYWORDS = (
     "送って",
@@ -201,6 +227,16 @@ _SEND_FILE_KEYWORDS = (
 )
 
 
+async def _read_attachment(attachment: discord.Attachment) -> bytes:
+    """Download *attachment*, holding a slot of the global read limit."""
+    loop = asyncio.get_running_loop()
+    sem = _read_semaphores.get(loop)
+    if sem is None:
+        sem = _read_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_READS)
+    async with sem:
+        return await attachment.read()
+
+
 def wants_file_attachment(prompt: str) -> bool:
     """Return True if *prompt* contains a file-send/attach request.
 
@@ -271,6 +307,10 @@ def _build_attachment_header(saved_files: list[tuple[str, str]]) -> str:
 # Maximum size for attachments saved to disk (10 MB — generous for PDFs/Excel).
 MAX_SAVE_BYTES = 10_000_000
 
+# Delimiters around each inline text attachment in the prompt.
+_ATTACHED_FILE_OPEN = "\n\n--- Attached file: "
+_ATTACHED_FILE_CLOSE = " ---\n"
+
 
 async def build_prompt_and_images(
     message: discord.Message,
@@ -304,27 +344,36 @@ async def build_prompt_and_images(
     if not message.attachments:
         return prompt, []
 
+    # First pass: filter on attachment metadata only, so every download that
+    # survives can be fetched concurrently below.
     total_bytes = 0
-    sections: list[str] = []
-    images: list[ImageData] = []
-    # Track files saved to disk for the header.
-    saved_files: list[tuple[str, str]] = []
+    image_count = 0
+    # Each attachment is classified once here; the second pass reuses the kind.
+    eligible: list[tuple[discord.Attachment, str, _AttachmentKind]] = []
 
     for attachment in message.attachments[:MAX_ATTACHMENTS]:
-        content_type = attachment.content_type or ""
-
-        # When Discord auto-converts a long pasted message to a file, the
-        # content_type may be absent.  Fall back to extension-based detection.
-        if not content_type:
+        content_type = attachment.content_type
+        kind: _AttachmentKind
+        if content_type:
+            if content_type.startswith(IMAGE_MIME_PREFIXES):
+                kind = "image"
+            elif content_type.startswith(ALLOWED_MIME_PREFIXES):
+                kind = "text"
+            else:
+                kind = "file"
+        else:
+            # When Discord auto-converts a long pasted message to a file, the
+            # content_type may be absent.  Fall back to extension-based detection.
             ext = os.path.splitext(attachment.filename.lower())[1]
             if ext in _IMAGE_EXTENSIONS:
-                content_type = "image/png"  # triggers image download path below
+                content_type, kind = "image/png", "image"
             elif ext in _TEXT_EXTENSIONS:
-                content_type = "text/plain"
+                content_type, kind = "text/plain", "text"
+            else:
+                content_type, kind = "", "file"
 
-        # ---- Image attachments → download and base64-encode ----
-        if content_type.startswith(IMAGE_MIME_PREFIXES):
-            if len(images) >= MAX_IMAGES:
+        if kind == "image":
+            if image_count >= MAX_IMAGES:
                 logger.debug("Skipping image %s: max images reached", attachment.filename)
                 continue
             if attachment.size > MAX_IMAGE_BYTES:
@@ -334,11 +383,46 @@ async def build_prompt_and_images(
                     attachment.size,
                 )
                 continue
+            image_count += 1
+        elif kind == "text":
+            total_bytes += min(attachment.size, MAX_ATTACHMENT_BYTES)
+            if total_bytes > MAX_TOTAL_BYTES:
+                logger.debug("Stopping attachment processing: total size exceeded")
+                break
+        elif save_dir is None or attachment.size > MAX_SAVE_BYTES:
+            logger.debug(
+                "Skipping attachment %s: unsupported type %s",
+                attachment.filename,
+                content_type,
+            )
+            continue
+        eligible.append((attachment, content_type, kind))
+
+    if not eligible:
+        return prompt, []
+
+    # Each read is a round trip to Discord's CDN — fetch them in parallel.
+    downloads = await asyncio.gather(
+        *(_read_attachment(attachment) for attachment, _, _ in eligible), return_exceptions=True
+    )
+
+    sections: list[str] = []
+    images: list[ImageData] = []
+    # Track files saved to disk for the header.
+    saved_files: list[tuple[str, str]] = []
+
+    for (attachment, content_type, kind), data in zip(eligible, downloads, strict=True):
+        if isinstance(data, BaseException):
+            logger.debug("Failed to download attachment %s", attachment.filename, exc_info=data)
+            continue
+
+        # ---- Image attachments → base64-encode ----
+        if kind == "image":
             try:
-                raw = await attachment.read()
                 media_type = _detect_media_type(content_type, attachment.filename)
-                raw, media_type = _convert_image_if_needed(raw, media_type)
-                encoded = base64.standard_b64encode(raw).decode("ascii")
+                # Pillow conversion and base64 of a multi-MB image take long
+                # enough to stall the gateway heartbeat; keep them off the loop.
+                raw, media_type, encoded = await asyncio.to_thread(_encode_image, data, media_type)
                 images.append(ImageData(data=encoded, media_type=media_type))
                 logger.debug(
                     "Downloaded and encoded image %s (%d bytes, %s)",
@@ -346,62 +430,43 @@ async def build_prompt_and_images(
                     len(raw),
                     media_type,
                 )
-                # Also save to disk if save_dir is provided.
-                if save_dir is not None:
-                    saved = await _save_attachment_to_disk(attachment, save_dir, raw=raw)
-                    if saved:
-                        saved_files.append((attachment.filename, saved))
             except Exception:
-                logger.debug("Failed to download image %s", attachment.filename, exc_info=True)
-            continue
+                logger.debug("Failed to encode image %s", attachment.filename, exc_info=True)
+                continue
+            data = raw
 
         # ---- Text attachments → inline in prompt ----
-        if content_type.startswith(ALLOWED_MIME_PREFIXES):
-            total_bytes += min(attachment.size, MAX_ATTACHMENT_BYTES)
-            if total_bytes > MAX_TOTAL_BYTES:
-                logger.debug("Stopping attachment processing: total size exceeded")
-                break
-            try:
-                data = await attachment.read()
-                text = data.decode("utf-8", errors="replace")
-                if len(text) > MAX_ATTACHMENT_BYTES:
-                    truncated_chars = MAX_ATTACHMENT_BYTES
-                    notice = (
-                        f"\n... [truncated: showing first {truncated_chars // 1000}KB"
-                        f" of {len(text) // 1000}KB]"
-                    )
-                    text = text[:truncated_chars] + notice
-                    logger.debug(
-                        "Truncated attachment %s from %d to %d chars",
-                        attachment.filename,
-                        len(data),
-                        truncated_chars,
-                    )
-                sections.append(f"\n\n--- Attached file: {attachment.filename} ---\n{text}")
-                # Also save to disk if save_dir is provided.
-                if save_dir is not None:
-                    saved = await _save_attachment_to_disk(attachment, save_dir, raw=data)
-                    if saved:
-                        saved_files.append((attachment.filename, saved))
-            except Exception:
-                logger.debug("Failed to read attachment %s", attachment.filename, exc_info=True)
-            continue
+        elif kind == "text":
+            # Decode only what can be shown (UTF-8 needs at most 4 bytes per
+            # character) so a multi-MB file never becomes a multi-MB str.
+            decode_limit = MAX_ATTACHMENT_BYTES * 4
+            text = data[:decode_limit].decode("utf-8", errors="replace")
+            if len(text) > MAX_ATTACHMENT_BYTES or len(data) > decode_limit:
+                truncated_chars = MAX_ATTACHMENT_BYTES
+                notice = (
+                    f"\n... [truncated: showing first {truncated_chars // 1000}KB"
+                    f" of {len(data) // 1000}KB]"
+                )
+                text = text[:truncated_chars] + notice
+                logger.debug(
+                    "Truncated attachment %s from %d to %d chars",
+                    attachment.filename,
+                    len(data),
+                    truncated_chars,
+                )
+            # Emit the parts directly so the (up to 200 KB) text is copied only
+            # once, by the final join.
+            sections.extend((_ATTACHED_FILE_OPEN, attachment.filename, _ATTACHED_FILE_CLOSE, text))
 
-        # ---- Other binary attachments (PDF, Excel, etc.) → save to disk only ----
-        if save_dir is not None and attachment.size <= MAX_SAVE_BYTES:
-            saved = await _save_attachment_to_disk(attachment, save_dir)
+        # Other binary attachments (PDF, Excel, etc.) are only saved to disk.
+        if save_dir is not None:
+            saved = await _save_attachment_to_disk(attachment, save_dir, raw=data)
             if saved:
                 saved_files.append((attachment.filename, saved))
-        else:
-            logger.debug(
-                "Skipping attachment %s: unsupported type %s",
-                attachment.filename,
-                content_type,
-            )
 
     # Build the final prompt.  When files are saved, prepend a header so
     # Claude immediately sees what was attached and where to find them.
-    inline_prompt = prompt + "".join(sections)
+    inline_prompt = "".join((prompt, *sections))
     if saved_files:
         header = _build_attachment_header(saved_files)
         return f"{header}\n\n{inline_prompt}", images
@@ -35,6 +35,11 @@ logger = logging.getLogger(__name__)
 # How often the master loop wakes up to check for due tasks.
 MASTER_LOOP_INTERVAL_SECONDS = 30
 
+# Scheduled tasks allowed past thread creation at once.  Sessions are also
+# bounded by the global slot limiter, but a burst of due tasks (e.g. after a
+# restart) would otherwise create every thread and post every header up front.
+MAX_CONCURRENT_SCHEDULED_TASKS = 4
+
 
 class SchedulerCog(commands.Cog):
     """Cog that periodically runs Claude Code tasks stored in SQLite.
@@ -59,6 +64,7 @@ class SchedulerCog(commands.Cog):
         self.session_repo = session_repo
         # Track in-flight tasks to avoid double-running the same task_id.
         self._running: set[int] = set()
+        self._task_sem = asyncio.Semaphore(MAX_CONCURRENT_SCHEDULED_TASKS)
 
     async def cog_load(self) -> None:
         """Start the master loop when the Cog is loaded."""
@@ -78,16 +84,20 @@ class SchedulerCog(commands.Cog):
             return
 
         logger.info("SchedulerCog: %d task(s) due", len(due))
+        ready: list[dict] = []
         for task in due:
-            task_id: int = task["id"]
-            if task_id in self._running:
-                logger.debug("Task %d still running — skipping", task_id)
+            if task["id"] in self._running:
+                logger.debug("Task %d still running — skipping", task["id"])
                 continue
+            ready.append(task)
 
-            # Advance next_run_at *before* spawning to prevent duplicate runs
-            # if the loop fires again before the task finishes.
-            await self.repo.update_next_run(task_id, interval_seconds=task["interval_seconds"])
+        # Advance next_run_at *before* spawning to prevent duplicate runs
+        # if the loop fires again before the tasks finish — one transaction
+        # for the whole batch.
+        await self.repo.update_next_runs([(t["id"], t["interval_seconds"]) for t in ready])
 
+        for task in ready:
+            task_id: int = task["id"]
             asyncio.create_task(
                 self._run_task(task),
                 name=f"ccdb-scheduler-{task_id}",
@@ -109,60 +119,64 @@ class SchedulerCog(commands.Cog):
         task_id: int = task["id"]
         self._running.add(task_id)
         try:
-            thread_id = task.get("thread_id")
-            session_id: str | None = None
-
-            if thread_id:
-                # Follow-up mode: post into an existing thread
-                thread = self.bot.get_channel(thread_id)
-                if thread is None or not isinstance(thread, discord.Thread):
-                    logger.warning(
-                        "SchedulerCog: thread %d not found for task %d (%s) — falling back",
-                        thread_id,
-                        task_id,
-                        task["name"],
-                    )
+            # Queued tasks stay in _running so the master loop won't respawn them.
+            async with self._task_sem:
+                thread_id = task.get("thread_id")
+                session_id: str | None = None
+
+                if thread_id:
+                    # Follow-up mode: post into an existing thread
+                    thread = self.bot.get_channel(thread_id)
+                    if thread is None or not isinstance(thread, discord.Thread):
+                        logger.warning(
+                            "SchedulerCog: thread %d not found for task %d (%s) — falling back",
+                            thread_id,
+                            task_id,
+                            task["name"],
+                        )
+                        thread = await self._create_new_thread(task)
+                        if thread is None:
+                            return
+                    else:
+                        await thread.send(f"🔄 **[Follow-up]** `{task['name']}`")
+                        # Try to resume the previous session in this thread
+                        if self.session_repo is not None:
+                            record = await self.session_repo.get(thread_id)
+                            if record is not None:
+                                session_id = record.session_id
+                                logger.info(
+                                    "SchedulerCog: resuming session %s in thread %d",
+                                    session_id,
+                                    thread_id,
+                                )
+                else:
+                    # Original behavior: create a new thread
                     thread = await self._create_new_thread(task)
                     if thread is None:
                         return
-                else:
-                    await thread.send(f"🔄 **[Follow-up]** `{task['name']}`")
-                    # Try to resume the previous session in this thread
-                    if self.session_repo is not None:
-                        record = await self.session_repo.get(thread_id)
-                        if record is not None:
-                            session_id = record.session_id
-                            logger.info(
-                                "SchedulerCog: resuming session %s in thread %d",
-                                session_id,
-                                thread_id,
-                            )
-            else:
-                # Original behavior: create a new thread
-                thread = await self._create_new_thread(task)
-                if thread is None:
-                    return
-
-            cloned = self.runner.clone()
-            if task.get("working_dir"):
-                cloned.working_dir = task["working_dir"]
-
-            registry = getattr(self.bot, "session_registry", None)
-            await run_claude_with_config(
-                RunConfig(
-                    thread=thread,
-                    runner=cloned,
-                    repo=self.session_repo,
-                    prompt=task["prompt"],
-                    session_id=session_id,
-                    registry=registry,
+
+                cloned = self.runner.clone()
+                if task.get("working_dir"):
+                    cloned.working_dir = task["working_dir"]
+
+                registry = getattr(self.bot, "session_registry", None)
+                await run_claude_with_config(
+                    RunConfig(
+                        thread=thread,
+                        runner=cloned,
+                        repo=self.session_repo,
+                        prompt=task["prompt"],
+                        session_id=session_id,
+                        registry=registry,
+                    )
                 )
-            )
 
-            # One-shot tasks auto-disable after execution
-            if task.get("one_shot"):
-                await self.repo.set_enabled(task_id, enabled=False)
-                logger.info("SchedulerCog: one-shot task %d (%s) disabled", task_id, task["name"])
+                # One-shot tasks auto-disable after execution
+                if task.get("one_shot"):
+                    await self.repo.set_enabled(task_id, enabled=False)
+                    logger.info(
+                        "SchedulerCog: one-shot task %d (%s) disabled", task_id, task["name"]
+                    )
 
         except Exception:
             logger.exception("SchedulerCog: task %d (%s) failed", task_id, task["name"])
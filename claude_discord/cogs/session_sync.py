@@ -124,10 +124,11 @@ async def sync_cli_sessions(
     imported = 0
     skipped = 0
 
+    # Which sessions are already tracked — one lookup for the whole scan.
+    known = await repo.existing_session_ids([s.session_id for s in cli_sessions])
+
     for cli_session in cli_sessions:
-        # Check if already tracked
-        existing = await repo.get_by_session_id(cli_session.session_id)
-        if existing:
+        if cli_session.session_id in known:
             skipped += 1
             continue
 
@@ -144,6 +145,8 @@ async def sync_cli_sessions(
             origin="cli",
             summary=cli_session.summary,
         )
+        # The scan can return the same session_id more than once.
+        known.add(cli_session.session_id)
 
         # Post info embed inside the thread (for channel-style threads
         # this is the main content; for message-style the embed is on
@@ -83,12 +83,19 @@ class WebhookTriggerCog(commands.Cog):
         self._registry = registry or getattr(bot, "session_registry", None)
         self._locks: dict[str, asyncio.Lock] = {prefix: asyncio.Lock() for prefix in triggers}
         self._active_count: int = 0
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
 
     @property
     def active_count(self) -> int:
         """Number of currently running webhook-triggered Claude sessions."""
         return self._active_count
 
+    @property
+    def idle_event(self) -> asyncio.Event:
+        """Set while no trigger is running (satisfies IdleSignaling protocol)."""
+        return self._idle_event
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         """Handle incoming messages, filtering for webhook triggers."""
@@ -151,6 +158,7 @@ class WebhookTriggerCog(commands.Cog):
             runner.allowed_tools = trigger.allowed_tools
 
         self._active_count += 1
+        self._idle_event.clear()
         try:
             session_id = await run_claude_with_config(
                 RunConfig(
@@ -170,3 +178,5 @@ class WebhookTriggerCog(commands.Cog):
                 await message.add_reaction("❌")
         finally:
             self._active_count -= 1
+            if self._active_count == 0:
+                self._idle_event.set()
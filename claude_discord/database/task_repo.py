@@ -226,26 +226,39 @@ class TaskRepository:
         When the task has anchor_hour set, snaps to the next wall-clock
         occurrence instead of using ``now + interval_seconds``.
         """
+        await self.update_next_runs([(task_id, interval_seconds)])
+
+    async def update_next_runs(self, runs: list[tuple[int, int]]) -> None:
+        """Advance several tasks given as ``(task_id, interval_seconds)`` pairs.
+
+        Same rules as :meth:`update_next_run`, applied in one connection and
+        a single commit so a batch of due tasks costs one transaction.
+        """
+        if not runs:
+            return
         now = time.time()
-        # Check if this task has an anchor
         async with aiosqlite.connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT anchor_hour, anchor_minute FROM scheduled_tasks WHERE id = ?",
-                (task_id,),
-            )
-            row = await cursor.fetchone()
-            if row is not None and row["anchor_hour"] is not None:
-                next_run = self._next_anchor(
-                    row["anchor_hour"], row["anchor_minute"] or 0, interval_seconds
+            updates: list[tuple[float, float, int]] = []
+            for task_id, interval_seconds in runs:
+                # Check if this task has an anchor
+                cursor = await db.execute(
+                    "SELECT anchor_hour, anchor_minute FROM scheduled_tasks WHERE id = ?",
+                    (task_id,),
                 )
-            else:
-                next_run = now + interval_seconds
-            await db.execute(
+                row = await cursor.fetchone()
+                if row is not None and row["anchor_hour"] is not None:
+                    next_run = self._next_anchor(
+                        row["anchor_hour"], row["anchor_minute"] or 0, interval_seconds
+                    )
+                else:
+                    next_run = now + interval_seconds
+                updates.append((next_run, now, task_id))
+            await db.executemany(
                 """UPDATE scheduled_tasks
                    SET next_run_at = ?, last_run_at = ?
                    WHERE id = ?""",
-                (next_run, now, task_id),
+                updates,
             )
             await db.commit()
 
@@ -126,10 +126,17 @@ class StatusManager:
 
     async def _set_status(self, emoji: str) -> None:
         """Set the target emoji with debouncing."""
+        task = self._debounce_task
+        pending = task is not None and not task.done()
+        # Repeated calls with the same status (e.g. set_thinking after every
+        # tool result) neither restart the pending debounce nor schedule a
+        # no-op apply.
+        if emoji == self._target_emoji and (pending or emoji == self._current_emoji):
+            return
         self._target_emoji = emoji
 
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
+        if task is not None and pending:
+            task.cancel()
 
         self._debounce_task = asyncio.create_task(self._apply_debounced())
 
@@ -47,6 +47,11 @@ _STATE_LABEL: dict[str, str] = {
 # Keeps the embed from accumulating stale entries after a long idle period.
 _STALE_HOURS = 4
 
+# Minimum seconds between dashboard edits.  State changes inside the window
+# are coalesced into one trailing edit, so a burst of transitions (several
+# sessions starting and finishing together) costs two API calls, not one each.
+_REFRESH_INTERVAL = 0.5
+
 
 class ThreadState(str, Enum):  # noqa: UP042 — requires-python = ">=3.10", StrEnum is 3.11+
     """Lifecycle state of a Claude Code session thread."""
@@ -80,6 +85,12 @@ class ThreadStatusDashboard:
     Thread safety
     -------------
     All public methods are coroutines protected by an ``asyncio.Lock``.
+
+    Rate limiting
+    -------------
+    The embed is edited at most once per ``_REFRESH_INTERVAL``; changes made
+    in between are applied by a single deferred edit.  Call ``flush()`` to
+    apply a pending edit immediately.
     """
 
     def __init__(
@@ -92,6 +103,9 @@ class ThreadStatusDashboard:
         self._threads: dict[int, _ThreadInfo] = {}
         self._dashboard_message: discord.Message | None = None
         self._lock = asyncio.Lock()
+        self._last_refresh = float("-inf")
+        # Deferred edit covering every change since the last refresh.
+        self._pending_refresh: asyncio.Task[None] | None = None
         # Persistent inbox entries (populated from DB when inbox is enabled).
         self._inbox: list[InboxEntry] = []
 
@@ -153,7 +167,7 @@ class ThreadStatusDashboard:
                 and thread is not None
             )
 
-            await self._refresh_dashboard()
+            await self._request_refresh()
 
         # Send mention outside the lock to avoid holding it during an HTTP call
         if should_mention and thread is not None:
@@ -168,7 +182,7 @@ class ThreadStatusDashboard:
         """Remove a thread from the dashboard and refresh."""
         async with self._lock:
             self._threads.pop(thread_id, None)
-            await self._refresh_dashboard()
+            await self._request_refresh()
 
     async def refresh_inbox(self, inbox_repo: ThreadInboxRepository) -> None:
         """Reload inbox entries from DB and refresh the dashboard embed.
@@ -178,12 +192,41 @@ class ThreadStatusDashboard:
         entries = await inbox_repo.list_all()
         async with self._lock:
             self._inbox = entries
+            await self._request_refresh()
+
+    async def flush(self) -> None:
+        """Apply a pending deferred edit now instead of waiting for the interval."""
+        async with self._lock:
+            if self._pending_refresh is None:
+                return
+            self._pending_refresh.cancel()
+            self._pending_refresh = None
             await self._refresh_dashboard()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _request_refresh(self) -> None:
+        """Refresh now, or defer if the embed was edited within the interval.
+
+        Must be called while the caller holds ``self._lock``.  At most one
+        deferred edit is pending; it renders whatever state exists when it runs.
+        """
+        if self._pending_refresh is not None:
+            return
+        delay = self._last_refresh + _REFRESH_INTERVAL - time.monotonic()
+        if delay <= 0:
+            await self._refresh_dashboard()
+        else:
+            self._pending_refresh = asyncio.create_task(self._deferred_refresh(delay))
+
+    async def _deferred_refresh(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        async with self._lock:
+            self._pending_refresh = None
+            await self._refresh_dashboard()
+
     async def _refresh_dashboard(self) -> None:
         """Edit the dashboard message with current state.
 
@@ -196,6 +239,7 @@ class ThreadStatusDashboard:
             return
 
         embed = self._build_embed()
+        self._last_refresh = time.monotonic()
         try:
             await self._dashboard_message.edit(embed=embed)
         except discord.NotFound:
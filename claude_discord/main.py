@@ -21,6 +21,7 @@ from claude_code_core.backend import create_backend
 from .bot import ClaudeDiscordBot
 from .cog_loader import load_custom_cogs
 from .setup import setup_bridge
+from .utils.event_loop import run, use_eager_tasks
 from .utils.logger import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -74,6 +75,7 @@ def load_config() -> dict[str, str]:
         "custom_cogs_dir": os.getenv("CUSTOM_COGS_DIR", ""),
         "cli_sessions_path": os.getenv("CLI_SESSIONS_PATH", ""),
         "thread_inbox_enabled": os.getenv("THREAD_INBOX_ENABLED", "false"),
+        "eager_tasks": os.getenv("CCDB_EAGER_TASKS", "false"),
     }
 
 
@@ -81,6 +83,10 @@ async def main() -> None:
     """Start the bot."""
     setup_logging()
     config = load_config()
+    # Opt-in: eager tasks run synchronously up to their first await inside
+    # create_task(), which changes scheduling order for every Cog.
+    if config["eager_tasks"].lower() in ("true", "1", "yes"):
+        use_eager_tasks(asyncio.get_running_loop())
 
     channel_id = int(config["channel_id"])
 
@@ -197,4 +203,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
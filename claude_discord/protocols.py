@@ -6,7 +6,10 @@ required attributes satisfies the protocol — no explicit inheritance needed.
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 @runtime_checkable
@@ -22,3 +25,30 @@ class DrainAware(Protocol):
 
     @property
     def active_count(self) -> int: ...
+
+
+@runtime_checkable
+class ActiveRunnerAware(Protocol):
+    """A Cog that can list the threads with a Claude session currently running.
+
+    AutoUpgradeCog snapshots these IDs before restarting so the sessions
+    can be marked for automatic resume on the next startup.
+    """
+
+    def active_thread_ids(self) -> frozenset[int]: ...
+
+
+@runtime_checkable
+class IdleSignaling(Protocol):
+    """A DrainAware Cog that signals the moment it becomes idle.
+
+    When every busy DrainAware Cog also satisfies this protocol,
+    AutoUpgradeCog awaits their events instead of polling ``active_count``,
+    so the restart starts as soon as the last session finishes.
+
+    Implementors expose an ``idle_event`` that is set while
+    ``active_count == 0`` and cleared while work is in flight.
+    """
+
+    @property
+    def idle_event(self) -> asyncio.Event: ...
@@ -0,0 +1,33 @@
+"""Event loop selection for the bot process."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Coroutine
+from typing import Any
+
+
+def run(main: Coroutine[Any, Any, None]) -> None:
+    """Run *main* to completion, on uvloop when it is installed.
+
+    uvloop is optional (the ``[uvloop]`` extra, not available on Windows);
+    without it the standard asyncio loop is used.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
+
+
+def use_eager_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Start new tasks eagerly on *loop* (Python 3.12+, no-op before).
+
+    With ``asyncio.eager_task_factory`` a task runs synchronously until its
+    first suspension, so the many short sends/edits that complete without
+    blocking never go through the ready queue.
+    """
+    if sys.version_info >= (3, 12):
+        loop.set_task_factory(asyncio.eager_task_factory)
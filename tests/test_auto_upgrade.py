@@ -59,10 +59,47 @@ def _make_process(
 ) -> MagicMock:
     proc = MagicMock()
     proc.returncode = returncode
-    proc.communicate = AsyncMock(return_value=(stdout, b""))
+    proc.stdout = asyncio.StreamReader()
+    proc.stdout.feed_data(stdout)
+    proc.stdout.feed_eof()
+    proc.wait = AsyncMock(return_value=returncode)
     return proc
 
 
+def _approval_payload(message_id: int = 99999, user_id: int = 42, emoji: str = "✅") -> MagicMock:
+    return MagicMock(message_id=message_id, user_id=user_id, emoji=emoji)
+
+
+def _capture_reaction_listener(bot: MagicMock) -> list:
+    """Record the listeners _wait_for_approval registers via bot.add_listener."""
+    listeners: list = []
+    bot.add_listener = MagicMock(side_effect=lambda fn, name=None: listeners.append(fn))
+    return listeners
+
+
+def _approve_on_listen(bot: MagicMock) -> None:
+    """Dispatch an approving ✅ reaction as soon as the listener is registered."""
+    tasks: list[asyncio.Task] = []
+
+    def add_listener(fn, name=None) -> None:
+        tasks.append(asyncio.get_running_loop().create_task(fn(_approval_payload())))
+
+    bot.add_listener = MagicMock(side_effect=add_listener)
+
+
+def _approve_on_reminder(bot: MagicMock, thread: MagicMock, approval_msg: MagicMock) -> None:
+    """Time out once (posting a reminder), then approve via the reaction listener."""
+    listeners = _capture_reaction_listener(bot)
+    tasks: list[asyncio.Task] = []
+
+    async def send(content: str, *args, **kwargs):
+        if content.startswith("⏳ Still waiting"):
+            tasks.append(asyncio.create_task(listeners[0](_approval_payload())))
+        return approval_msg
+
+    thread.send = AsyncMock(side_effect=send)
+
+
 class TestFiltering:
     """Test message filtering logic."""
 
@@ -127,6 +164,45 @@ class TestFiltering:
         await cog.on_message(msg)
         msg.create_thread.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_surrounding_whitespace_still_matches(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """Leading/trailing whitespace around the trigger prefix is ignored."""
+        msg = _make_message(content="  🔄 ebibot-upgrade\n")
+        with patch.object(cog, "_run_upgrade", new_callable=AsyncMock) as run_upgrade:
+            await cog.on_message(msg)
+        run_upgrade.assert_awaited_once_with(msg)
+
+
+class TestListenerRegistration:
+    """on_message is only registered when a webhook message could match."""
+
+    @pytest.mark.asyncio
+    async def test_listener_registered_on_load_and_removed_on_unload(
+        self, bot: MagicMock, cog: AutoUpgradeCog
+    ) -> None:
+        await cog.cog_load()
+        bot.add_listener.assert_called_once_with(cog.on_message, "on_message")
+
+        cog.cog_unload()
+        bot.remove_listener.assert_called_once_with(cog.on_message, "on_message")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("field", ["allowed_webhook_ids", "channel_ids"])
+    async def test_empty_allowlist_skips_listener(self, bot: MagicMock, field: str) -> None:
+        cog = AutoUpgradeCog(bot=bot, config=UpgradeConfig(package_name="pkg", **{field: set()}))
+
+        await cog.cog_load()
+        cog.cog_unload()
+
+        bot.add_listener.assert_not_called()
+        bot.remove_listener.assert_not_called()
+
+    def test_on_message_is_not_a_class_level_listener(self, cog: AutoUpgradeCog) -> None:
+        assert "on_message" not in [name for name, _ in cog.get_listeners()]
+
 
 class TestUpgradeSteps:
     """Test upgrade step execution.
@@ -185,6 +261,229 @@ class TestUpgradeSteps:
         send_calls = [str(c) for c in thread.send.call_args_list]
         assert any("Upgrade complete" in s for s in send_calls)
 
+    @pytest.mark.asyncio
+    async def test_step_header_is_edited_in_place(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """Step banners share one header message that is edited, not re-posted."""
+        msg = _make_message()
+        thread = msg.create_thread.return_value
+        header = MagicMock(spec=discord.Message)
+        header.edit = AsyncMock()
+        thread.send = AsyncMock(return_value=header)
+
+        with patch(
+            _PATCH_EXEC, new_callable=AsyncMock, side_effect=lambda *a, **k: _make_process()
+        ):
+            await cog.on_message(msg)
+
+        upgrade_banner = "⚙️ `uv lock --upgrade-package claude-code-discord-bridge`"
+        sent = [c.args[0] for c in thread.send.call_args_list]
+        assert sent[0] == upgrade_banner
+        assert "⚙️ `uv sync`" not in sent
+        # Each step's output is labelled with its own banner.
+        assert sent[1] == f"{upgrade_banner}\n```\nok\n```"
+        assert sent[2] == "⚙️ `uv sync`\n```\nok\n```"
+        # The header ends on the pipeline's final status.
+        assert [c.kwargs["content"] for c in header.edit.await_args_list] == [
+            "⚙️ `uv sync`",
+            "✅ Upgrade succeeded.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_step_header_shows_failure(self, cog: AutoUpgradeCog) -> None:
+        """A failed step leaves the header on the failure status."""
+        msg = _make_message()
+        thread = msg.create_thread.return_value
+        header = MagicMock(spec=discord.Message)
+        header.edit = AsyncMock()
+        thread.send = AsyncMock(return_value=header)
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=_make_process(returncode=1)):
+            await cog.on_message(msg)
+
+        header.edit.assert_awaited_once_with(content="❌ Upgrade failed.")
+
+    @pytest.mark.asyncio
+    async def test_header_failure_discards_spawned_upgrade(self, cog: AutoUpgradeCog) -> None:
+        """If the header can't be posted, the pre-spawned upgrade is killed and reaped."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock(side_effect=[discord.HTTPException(MagicMock(), "boom"), None])
+        proc = _make_process()
+        proc.returncode = None
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc):
+            await cog._run_pipeline(thread, status_target=None)
+
+        proc.kill.assert_called_once()
+        proc.wait.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_step_progress_previewed_in_header(self, cog: AutoUpgradeCog) -> None:
+        """Output arriving after the progress interval is previewed, then the banner restored."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        header = MagicMock(spec=discord.Message)
+        header.edit = AsyncMock()
+        proc = _make_process(returncode=0, stdout=b"Resolved 42 packages\n")
+
+        with (
+            patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc),
+            patch("claude_discord.cogs.auto_upgrade._PROGRESS_INTERVAL", 0),
+        ):
+            await cog._run_step(thread, "sync", ["uv", "sync"], header=header, banner="⚙️ sync")
+
+        assert [c.kwargs["content"] for c in header.edit.call_args_list] == [
+            "⚙️ sync\n```\nResolved 42 packages\n```",
+            "⚙️ sync",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_step_progress_edit_failure_is_ignored(self, cog: AutoUpgradeCog) -> None:
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        header = MagicMock(spec=discord.Message)
+        header.edit = AsyncMock(side_effect=discord.HTTPException(MagicMock(), "rate limited"))
+        proc = _make_process(returncode=0)
+
+        with (
+            patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc),
+            patch("claude_discord.cogs.auto_upgrade._PROGRESS_INTERVAL", 0),
+        ):
+            ok = await cog._run_step(thread, "sync", ["uv", "sync"], header=header, banner="x")
+
+        assert ok is True
+
+    @pytest.mark.asyncio
+    async def test_step_output_is_streamed_and_tail_posted(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """Only the tail of a long log is kept and posted, in a single code block."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        log = b"".join(f"line {i}\n".encode() for i in range(10_000))
+        proc = _make_process(returncode=0, stdout=log)
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc):
+            ok = await cog._run_step(thread, "sync", ["uv", "sync"])
+
+        assert ok is True
+        proc.wait.assert_awaited_once()
+        block = thread.send.call_args_list[0].args[0]
+        assert block.startswith("```\n")
+        assert "line 9999" in block
+        assert "line 0\n" not in block
+        assert len(block) <= 1800 + len("```\n\n```")
+
+    @pytest.mark.asyncio
+    async def test_step_output_without_newlines_is_read(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """A single line longer than StreamReader's 64 KiB limit doesn't break the step."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        proc = _make_process(returncode=0, stdout=b"x" * 200_000 + b"END")
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc):
+            ok = await cog._run_step(thread, "sync", ["uv", "sync"])
+
+        assert ok is True
+        block = thread.send.call_args_list[0].args[0]
+        assert block.endswith("END\n```")
+
+    @pytest.mark.asyncio
+    async def test_step_output_decodes_only_the_tail(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """Multi-byte output is sliced before decoding without corrupting the posted tail."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        proc = _make_process(returncode=0, stdout="é".encode() * 50_000)
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc):
+            await cog._run_step(thread, "sync", ["uv", "sync"])
+
+        block = thread.send.call_args_list[0].args[0]
+        assert block == "```\n" + "é" * 1800 + "\n```"
+
+    @pytest.mark.asyncio
+    async def test_step_failure_reports_exit_code(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """A non-zero exit code posts the failure notice and returns False."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        proc = _make_process(returncode=2, stdout=b"boom\n")
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc):
+            ok = await cog._run_step(thread, "upgrade", ["uv", "lock"])
+
+        assert ok is False
+        # Output and failure notice share a single message.
+        thread.send.assert_awaited_once_with("```\nboom\n```\n❌ `upgrade` failed (exit code 2).")
+
+    @pytest.mark.asyncio
+    async def test_step_timeout_kills_subprocess(self, bot: MagicMock) -> None:
+        """A step that outlives step_timeout is killed and reaped, then the timeout propagates."""
+        cog = AutoUpgradeCog(bot=bot, config=UpgradeConfig(package_name="pkg", step_timeout=0))
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        proc = MagicMock()
+        proc.returncode = None
+        proc.stdout = asyncio.StreamReader()  # never reaches EOF
+        proc.wait = AsyncMock(return_value=-9)
+
+        with (
+            patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc),
+            pytest.raises((TimeoutError, asyncio.TimeoutError)),  # noqa: UP041
+        ):
+            await cog._run_step(thread, "sync", ["uv", "sync"])
+
+        proc.kill.assert_called_once()
+        proc.wait.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_finished_step_is_not_killed(self, cog: AutoUpgradeCog) -> None:
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        proc = _make_process()
+
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=proc):
+            await cog._run_step(thread, "sync", ["uv", "sync"])
+
+        proc.kill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finalize_sends_and_reacts_concurrently(self, cog: AutoUpgradeCog) -> None:
+        """The status line and reaction are in flight together; a failure is logged only."""
+        started: list[str] = []
+        gate = asyncio.Event()
+
+        async def send(text: str) -> None:
+            started.append("send")
+            await gate.wait()
+
+        async def react(emoji: str) -> None:
+            started.append("react")
+            gate.set()
+            raise discord.HTTPException(MagicMock(), "rate limited")
+
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock(side_effect=send)
+        target = MagicMock(spec=discord.Message)
+        target.add_reaction = AsyncMock(side_effect=react)
+
+        await cog._finalize(thread, target, "❌", "❌ Step timed out.")
+
+        assert started == ["send", "react"]
+        thread.send.assert_awaited_once_with("❌ Step timed out.")
+        target.add_reaction.assert_awaited_once_with("❌")
+
     @pytest.mark.asyncio
     async def test_restart_command_fired(
         self,
@@ -231,6 +530,49 @@ class TestUpgradeSteps:
         )
 
 
+class TestThreadOverlap:
+    """The upgrade subprocess starts once the thread exists, alongside the header post."""
+
+    @pytest.mark.asyncio
+    async def test_upgrade_spawned_after_thread_during_header(self, cog: AutoUpgradeCog) -> None:
+        msg = _make_message()
+        thread = msg.create_thread.return_value
+        spawned_before_thread: list[bool] = []
+        spawned_before_header: list[bool] = []
+
+        async def create_thread(**kwargs):
+            spawned_before_thread.append(exec_mock.await_count > 0)
+            return thread
+
+        async def send(*args, **kwargs):
+            if not spawned_before_header:
+                await asyncio.sleep(0)
+                spawned_before_header.append(exec_mock.await_count == 1)
+            return MagicMock(spec=discord.Message)
+
+        msg.create_thread = AsyncMock(side_effect=create_thread)
+        thread.send = AsyncMock(side_effect=send)
+        with patch(_PATCH_EXEC, new_callable=AsyncMock, return_value=_make_process()) as exec_mock:
+            await cog.on_message(msg)
+
+        assert spawned_before_thread == [False]
+        assert spawned_before_header == [True]
+        assert exec_mock.await_count == 2  # upgrade + sync, no duplicate upgrade
+
+    @pytest.mark.asyncio
+    async def test_thread_failure_spawns_nothing(self, cog: AutoUpgradeCog) -> None:
+        msg = _make_message()
+        msg.create_thread = AsyncMock(side_effect=discord.HTTPException(MagicMock(), "boom"))
+
+        with (
+            patch(_PATCH_EXEC, new_callable=AsyncMock) as exec_mock,
+            pytest.raises(discord.HTTPException),
+        ):
+            await cog._run_upgrade(msg)
+
+        exec_mock.assert_not_awaited()
+
+
 class TestDrainCheck:
     """Test graceful-drain-before-restart behaviour."""
 
@@ -342,6 +684,63 @@ class TestDrainCheck:
         send_texts = " ".join(str(c) for c in thread.send.call_args_list)
         assert "timeout" in send_texts.lower()
 
+    @pytest.mark.asyncio
+    async def test_drain_event_is_awaited_instead_of_polling(
+        self,
+        bot: MagicMock,
+    ) -> None:
+        """An explicit drain_event ends the drain as soon as it is set, with no poll sleeps."""
+        event = asyncio.Event()
+        cog = AutoUpgradeCog(bot=bot, config=UpgradeConfig(package_name="pkg"), drain_event=event)
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        asyncio.get_running_loop().call_soon(event.set)
+        with patch(_PATCH_SLEEP, new_callable=AsyncMock) as mock_sleep:
+            await cog._drain(thread)
+
+        mock_sleep.assert_not_called()
+        send_texts = " ".join(str(c) for c in thread.send.call_args_list)
+        assert "Sessions finished" in send_texts
+
+    @pytest.mark.asyncio
+    async def test_drain_event_wakeups_are_confirmed_by_drain_check(
+        self,
+        bot: MagicMock,
+    ) -> None:
+        """With both, the event wakes the drain and drain_check decides.
+
+        A set event whose wake-up drain_check rejects must not spin: the drain
+        falls back to poll-interval sleeps until the check passes.
+        """
+        event = asyncio.Event()
+        checks = 0
+
+        def drain_check() -> bool:
+            nonlocal checks
+            checks += 1
+            return checks > 3
+
+        cog = AutoUpgradeCog(
+            bot=bot,
+            config=UpgradeConfig(package_name="pkg"),
+            drain_check=drain_check,
+            drain_timeout=300,
+            drain_poll_interval=10,
+            drain_event=event,
+        )
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        asyncio.get_running_loop().call_soon(event.set)
+        with patch(_PATCH_SLEEP, new_callable=AsyncMock) as mock_sleep:
+            await cog._drain(thread)
+
+        assert checks == 4
+        assert mock_sleep.await_count == 2
+        send_texts = " ".join(str(c) for c in thread.send.call_args_list)
+        assert "Sessions finished" in send_texts
+
 
 class TestConcurrency:
     """Test concurrent execution prevention."""
@@ -352,13 +751,25 @@ class TestConcurrency:
         cog: AutoUpgradeCog,
     ) -> None:
         msg = _make_message()
-        await cog._lock.acquire()
-        try:
+        cog._upgrading = True
+        await cog.on_message(msg)
+        msg.reply.assert_called_once()
+        assert "already running" in msg.reply.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_guard_released_after_failure(
+        self,
+        cog: AutoUpgradeCog,
+    ) -> None:
+        """An upgrade that raises still clears the in-progress guard."""
+        msg = _make_message()
+        with (
+            patch.object(cog, "_run_upgrade", new_callable=AsyncMock, side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
             await cog.on_message(msg)
-            msg.reply.assert_called_once()
-            assert "already running" in msg.reply.call_args[0][0]
-        finally:
-            cog._lock.release()
+
+        assert cog._upgrading is False
 
 
 class TestUpgradeConfigDataclass:
@@ -381,6 +792,18 @@ class TestUpgradeConfigDataclass:
         with pytest.raises(AttributeError):
             config.package_name = "changed"  # type: ignore[misc]
 
+    def test_id_sets_are_frozen(self) -> None:
+        """Mutable ID sets are copied into frozensets so the config stays immutable."""
+        webhook_ids = {1, 2}
+        config = UpgradeConfig(
+            package_name="my-pkg", allowed_webhook_ids=webhook_ids, channel_ids={3}
+        )
+        webhook_ids.add(99)
+
+        assert config.allowed_webhook_ids == frozenset({1, 2})
+        assert isinstance(config.allowed_webhook_ids, frozenset)
+        assert isinstance(config.channel_ids, frozenset)
+
     def test_custom_commands(self) -> None:
         config = UpgradeConfig(
             package_name="my-pkg",
@@ -395,6 +818,26 @@ class TestUpgradeConfigDataclass:
         ]
         assert config.sync_command == ["pip", "check"]
 
+    def test_step_commands_resolved_at_init(self, bot: MagicMock) -> None:
+        """Default and custom step commands (and their banners) are resolved once."""
+        default = AutoUpgradeCog(bot=bot, config=UpgradeConfig(package_name="my-pkg"))
+        assert default._upgrade_cmd == ["uv", "lock", "--upgrade-package", "my-pkg"]
+        assert default._sync_banner == "⚙️ `uv sync`"
+
+        custom = AutoUpgradeCog(
+            bot=bot,
+            config=UpgradeConfig(package_name="my-pkg", sync_command=["pip", "check"]),
+        )
+        assert custom._sync_cmd == ["pip", "check"]
+        assert custom._sync_banner == "⚙️ `pip check`"
+
+    def test_thread_name_truncated_at_init(self, bot: MagicMock) -> None:
+        """The upgrade thread name is the trigger prefix capped at Discord's 100 chars."""
+        cog = AutoUpgradeCog(
+            bot=bot, config=UpgradeConfig(package_name="my-pkg", trigger_prefix="x" * 150)
+        )
+        assert cog._thread_name == "x" * 100
+
 
 class TestAutoDrainDiscovery:
     """Test auto-discovery of DrainAware Cogs."""
@@ -478,6 +921,123 @@ class TestAutoDrainDiscovery:
         assert cog._drain_check() is True
         assert explicit_called
 
+    @pytest.mark.asyncio
+    async def test_drain_awaits_idle_event_instead_of_polling(self) -> None:
+        """Busy IdleSignaling Cogs are awaited — no poll sleep, no interval latency."""
+        bot = MagicMock(spec=commands.Bot)
+
+        class SignallingCog:
+            def __init__(self) -> None:
+                self.count = 1
+                self._idle = asyncio.Event()
+
+            @property
+            def active_count(self) -> int:
+                return self.count
+
+            @property
+            def idle_event(self) -> asyncio.Event:
+                return self._idle
+
+            def finish(self) -> None:
+                self.count = 0
+                self._idle.set()
+
+        busy = SignallingCog()
+        cog = self._make_cog_with_restart(bot)
+        bot.cogs.values.return_value = [busy, cog]
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        asyncio.get_running_loop().call_soon(busy.finish)
+        with patch(_PATCH_SLEEP, new_callable=AsyncMock) as mock_sleep:
+            await cog._drain(thread)
+
+        mock_sleep.assert_not_called()
+        send_texts = " ".join(str(c) for c in thread.send.call_args_list)
+        assert "Sessions finished" in send_texts
+
+    @pytest.mark.asyncio
+    async def test_drain_polls_cogs_without_idle_event(self) -> None:
+        """A busy Cog without idle_event falls back to poll-interval sleeps."""
+        bot = MagicMock(spec=commands.Bot)
+        polls = 0
+
+        class CountOnlyCog:
+            @property
+            def active_count(self) -> int:
+                return 0 if polls else 1
+
+        async def fake_sleep(seconds: float) -> None:
+            nonlocal polls
+            polls += 1
+
+        cog = self._make_cog_with_restart(bot)
+        bot.cogs.values.return_value = [CountOnlyCog(), cog]
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        with patch(_PATCH_SLEEP, side_effect=fake_sleep) as mock_sleep:
+            await cog._drain(thread)
+
+        mock_sleep.assert_called_once_with(cog._drain_poll_interval)
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_when_idle_before_first_wait(self) -> None:
+        """Cogs going idle between check() and the loop don't hold the restart."""
+        bot = MagicMock(spec=commands.Bot)
+
+        class CountOnlyCog:
+            def __init__(self) -> None:
+                self.count = 1
+
+            @property
+            def active_count(self) -> int:
+                return self.count
+
+        busy = CountOnlyCog()
+        cog = self._make_cog_with_restart(bot)
+        bot.cogs.values.return_value = [busy, cog]
+        thread = MagicMock(spec=discord.Thread)
+
+        async def send(text: str) -> None:
+            # The last session finishes while the "waiting" notice is posted.
+            busy.count = 0
+
+        thread.send = AsyncMock(side_effect=send)
+
+        with patch(_PATCH_SLEEP, new_callable=AsyncMock) as mock_sleep:
+            await asyncio.wait_for(cog._drain(thread), timeout=1)
+
+        mock_sleep.assert_not_called()
+        assert "Sessions finished (0s)" in thread.send.call_args_list[-1].args[0]
+
+    @pytest.mark.asyncio
+    async def test_drain_scans_cogs_once(self) -> None:
+        """DrainAware Cogs are discovered once per drain, not on every poll."""
+        bot = MagicMock(spec=commands.Bot)
+        polls = 0
+
+        class CountOnlyCog:
+            @property
+            def active_count(self) -> int:
+                return 0 if polls >= 3 else 1
+
+        async def fake_sleep(seconds: float) -> None:
+            nonlocal polls
+            polls += 1
+
+        cog = self._make_cog_with_restart(bot)
+        bot.cogs.values.return_value = [CountOnlyCog(), cog]
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        with patch(_PATCH_SLEEP, side_effect=fake_sleep):
+            await cog._drain(thread)
+
+        assert polls == 3
+        bot.cogs.values.assert_called_once()
+
     def test_auto_drain_excludes_self(self) -> None:
         """AutoUpgradeCog should not check itself (it's not DrainAware anyway,
         but if it were, it should exclude itself to avoid deadlock)."""
@@ -519,13 +1079,9 @@ class TestRestartApproval:
         thread.send.return_value = approval_msg
 
         # Simulate immediate approval reaction
-        reaction_event = MagicMock()
-        reaction_event.message_id = 99999
-        reaction_event.emoji = "✅"
-        reaction_event.user_id = 42  # Not the bot
         bot.user = MagicMock()
         bot.user.id = 1  # Bot ID
-        bot.wait_for = AsyncMock(return_value=reaction_event)
+        _approve_on_listen(bot)
 
         await cog._wait_for_approval(MagicMock(), thread)
 
@@ -537,14 +1093,15 @@ class TestRestartApproval:
         thread.send.assert_any_call("👍 Restart approved!")
 
     @pytest.mark.asyncio
-    async def test_approval_mode_sends_reminder_on_timeout(
+    async def test_approval_check_filters_reactions(
         self,
         bot: MagicMock,
     ) -> None:
-        """When no reaction within timeout, sends reminder then waits again."""
+        """The listener approves only a non-bot ✅ on the approval message."""
         cog = self._make_cog_with_approval(bot)
         thread = MagicMock(spec=discord.Thread)
         thread.send = AsyncMock()
+        thread.parent = None
         approval_msg = MagicMock()
         approval_msg.id = 99999
         approval_msg.add_reaction = AsyncMock()
@@ -552,22 +1109,43 @@ class TestRestartApproval:
 
         bot.user = MagicMock()
         bot.user.id = 1
+        listeners = _capture_reaction_listener(bot)
+
+        waiter = asyncio.create_task(cog._wait_for_approval(MagicMock(), thread))
+        while not listeners:
+            await asyncio.sleep(0)
+        (listener,) = listeners
+
+        await listener(_approval_payload(message_id=1))
+        await listener(_approval_payload(user_id=1))
+        await listener(_approval_payload(emoji="❌"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await listener(_approval_payload())
+        await waiter
 
-        call_count = 0
+        bot.add_listener.assert_called_once_with(listener, "on_raw_reaction_add")
+        bot.remove_listener.assert_called_once_with(listener, "on_raw_reaction_add")
 
-        async def wait_for_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise TimeoutError
-            # Second call: return approval
-            event = MagicMock()
-            event.message_id = 99999
-            event.emoji = "✅"
-            event.user_id = 42
-            return event
+    @pytest.mark.asyncio
+    async def test_approval_mode_sends_reminder_on_timeout(
+        self,
+        bot: MagicMock,
+    ) -> None:
+        """When no reaction within timeout, sends reminder then waits again."""
+        cog = self._make_cog_with_approval(bot)
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+        approval_msg = MagicMock()
+        approval_msg.id = 99999
+        approval_msg.add_reaction = AsyncMock()
+        thread.send.return_value = approval_msg
 
-        bot.wait_for = AsyncMock(side_effect=wait_for_side_effect)
+        bot.user = MagicMock()
+        bot.user.id = 1
+        cog._drain_timeout = 0.01  # type: ignore[assignment]
+        _approve_on_reminder(bot, thread, approval_msg)
 
         await cog._wait_for_approval(MagicMock(), thread)
 
@@ -596,21 +1174,8 @@ class TestRestartApproval:
 
         bot.user = MagicMock()
         bot.user.id = 1
-
-        call_count = 0
-
-        async def wait_for_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise TimeoutError  # Python 3.10 asyncio variant
-            event = MagicMock()
-            event.message_id = 99999
-            event.emoji = "✅"
-            event.user_id = 42
-            return event
-
-        bot.wait_for = AsyncMock(side_effect=wait_for_side_effect)
+        cog._drain_timeout = 0.01  # type: ignore[assignment]
+        _approve_on_reminder(bot, thread, approval_msg)
 
         await cog._wait_for_approval(MagicMock(), thread)
 
@@ -646,9 +1211,8 @@ class TestRestartApproval:
         ):
             await cog.on_message(msg)
 
-        # Should have restarted without calling wait_for
-        bot.wait_for = AsyncMock()
-        bot.wait_for.assert_not_called()
+        # Should have restarted without registering an approval listener
+        bot.add_listener.assert_not_called()
         # restart command should have fired
         assert len(exec_calls) == 3
 
@@ -671,13 +1235,41 @@ class TestRestartApproval:
 
         with (
             patch(_PATCH_EXEC, new_callable=AsyncMock) as mock_sub,
-            patch(_PATCH_SLEEP, new_callable=AsyncMock),
+            patch(_PATCH_SLEEP, new_callable=AsyncMock) as mock_sleep,
         ):
-            await cog._restart(trigger_msg, thread)
+            await cog._restart(trigger_msg, thread, ["sudo", "systemctl", "restart", "bot.service"])
+
+        # The notice is acknowledged before the command fires — no settle delay.
+        mock_sleep.assert_not_called()
 
         thread.send.assert_called_with("🔄 Restarting...")
         trigger_msg.add_reaction.assert_called_with("✅")
         mock_sub.assert_called_once()
+        assert mock_sub.call_args.args == ("sudo", "systemctl", "restart", "bot.service")
+
+    @pytest.mark.asyncio
+    async def test_restart_spawn_allows_posix_spawn_fast_path(
+        self,
+        bot: MagicMock,
+    ) -> None:
+        """The restart spawn passes nothing that forces CPython onto fork+exec."""
+        cog = self._make_cog_with_approval(bot)
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        with (
+            patch(_PATCH_EXEC, new_callable=AsyncMock) as mock_sub,
+            patch(_PATCH_SLEEP, new_callable=AsyncMock),
+            patch("shutil.which", return_value="/usr/bin/systemctl") as mock_which,
+        ):
+            await cog._restart(None, thread, ["systemctl", "restart", "bot.service"])
+
+        mock_which.assert_called_once_with("systemctl")
+        kwargs = mock_sub.call_args.kwargs
+        assert kwargs["executable"] == "/usr/bin/systemctl"
+        assert kwargs["close_fds"] is False
+        assert "cwd" not in kwargs
+        assert mock_sub.call_args.args == ("systemctl", "restart", "bot.service")
 
 
 class TestActiveSessionCount:
@@ -713,6 +1305,7 @@ class TestActiveSessionCount:
 
         del cog._active_runners[1]
         assert cog.active_session_count == 1
+        assert cog.active_thread_ids() == frozenset({2})
 
 
 class TestMarkSessionsForResume:
@@ -727,19 +1320,20 @@ class TestMarkSessionsForResume:
         return AutoUpgradeCog(bot=bot, config=config)
 
     def test_collect_active_thread_ids_empty(self) -> None:
-        """Returns empty frozenset when no cog has _active_runners."""
+        """Returns empty frozenset when no cog is ActiveRunnerAware."""
         bot = MagicMock(spec=commands.Bot)
         bot.cogs.values.return_value = []
         cog = self._make_cog_with_restart(bot)
         assert cog._collect_active_thread_ids() == frozenset()
 
     def test_collect_active_thread_ids_from_cog(self) -> None:
-        """Collects thread IDs from cogs that have _active_runners."""
+        """Collects thread IDs from ActiveRunnerAware cogs."""
         bot = MagicMock(spec=commands.Bot)
         cog = self._make_cog_with_restart(bot)
 
         class FakeChatCog:
-            _active_runners = {111: MagicMock(), 222: MagicMock()}
+            def active_thread_ids(self) -> frozenset[int]:
+                return frozenset({111, 222})
 
         fake_chat = FakeChatCog()
         bot.cogs.values.return_value = [fake_chat, cog]
@@ -747,12 +1341,29 @@ class TestMarkSessionsForResume:
         result = cog._collect_active_thread_ids()
         assert result == frozenset({111, 222})
 
+    def test_collect_active_thread_ids_from_legacy_active_runners(self) -> None:
+        """Still discovers cogs that only expose an _active_runners dict."""
+        bot = MagicMock(spec=commands.Bot)
+        cog = self._make_cog_with_restart(bot)
+
+        class LegacyChatCog:
+            _active_runners = {333: MagicMock()}
+
+        class FakeChatCog:
+            def active_thread_ids(self) -> frozenset[int]:
+                return frozenset({111})
+
+        bot.cogs.values.return_value = [LegacyChatCog(), FakeChatCog(), cog]
+
+        result = cog._collect_active_thread_ids()
+        assert result == frozenset({111, 333})
+
     def test_collect_active_thread_ids_excludes_self(self) -> None:
-        """Does not include threads from the cog itself (it has no _active_runners)."""
+        """Does not include threads from the cog itself (it is not ActiveRunnerAware)."""
         bot = MagicMock(spec=commands.Bot)
         cog = self._make_cog_with_restart(bot)
-        # Manually give the cog an _active_runners to verify self-exclusion
-        cog._active_runners = {999: MagicMock()}  # type: ignore[attr-defined]
+        # Manually make the cog ActiveRunnerAware to verify self-exclusion
+        cog.active_thread_ids = lambda: frozenset({999})  # type: ignore[attr-defined]
         bot.cogs.values.return_value = [cog]
 
         # self is excluded
@@ -859,6 +1470,35 @@ class TestMarkSessionsForResume:
         thread.send.assert_called_once()
         assert "1" in thread.send.call_args.args[0]
 
+    @pytest.mark.asyncio
+    async def test_mark_sessions_runs_concurrently(self) -> None:
+        """All marks are in flight at once rather than awaited one by one."""
+        bot = MagicMock(spec=commands.Bot)
+        in_flight = 0
+        peak = 0
+
+        async def slow_mark(tid: int, **kwargs) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return tid
+
+        resume_repo = MagicMock()
+        resume_repo.mark = AsyncMock(side_effect=slow_mark)
+        bot.resume_repo = resume_repo
+        del bot.session_repo
+
+        cog = self._make_cog_with_restart(bot)
+        thread = MagicMock(spec=discord.Thread)
+        thread.send = AsyncMock()
+
+        await cog._mark_sessions_for_resume(frozenset({1, 2, 3}), thread)
+
+        assert peak == 3
+        assert "3 active session(s)" in thread.send.call_args.args[0]
+
     @pytest.mark.asyncio
     async def test_upgrade_marks_active_sessions_before_restart(self) -> None:
         """Integration: active sessions are marked for resume during upgrade."""
@@ -872,7 +1512,8 @@ class TestMarkSessionsForResume:
         del bot.session_repo
 
         class FakeChatCog:
-            _active_runners = {555: MagicMock()}
+            def active_thread_ids(self) -> frozenset[int]:
+                return frozenset({555})
 
         bot.cogs.values.return_value = [FakeChatCog()]
 
@@ -1056,12 +1697,6 @@ class TestApprovalButton:
         bot.user = MagicMock()
         bot.user.id = 1
 
-        async def capture_and_hang(*args, **kwargs):
-            # block until test sets the event externally
-            await asyncio.sleep(10)  # will be cancelled
-
-        bot.wait_for = AsyncMock(side_effect=capture_and_hang)
-
         async def run_and_inject() -> None:
             # Give _wait_for_approval time to create the view and post to parent
             await asyncio.sleep(0)
@@ -1091,12 +1726,7 @@ class TestApprovalButton:
         bot.user = MagicMock()
         bot.user.id = 1
 
-        # Reaction never fires (hangs until cancelled)
-        async def hang(*args, **kwargs):
-            await asyncio.sleep(60)
-
-        bot.wait_for = AsyncMock(side_effect=hang)
-
+        # No reaction is ever dispatched to the listener.
         # Inject button click after setup
         async def click_button() -> None:
             await asyncio.sleep(0)
@@ -1123,11 +1753,7 @@ class TestApprovalButton:
         bot.user = MagicMock()
         bot.user.id = 1
 
-        reaction_event = MagicMock()
-        reaction_event.message_id = 99999
-        reaction_event.emoji = "✅"
-        reaction_event.user_id = 42
-        bot.wait_for = AsyncMock(return_value=reaction_event)
+        _approve_on_listen(bot)
 
         await cog._wait_for_approval(MagicMock(), thread)
 
@@ -1137,7 +1763,7 @@ class TestApprovalButton:
 
     @pytest.mark.asyncio
     async def test_timeout_bumps_button_in_channel(self, bot: MagicMock) -> None:
-        """When the reaction watch times out, the channel button is re-posted at bottom."""
+        """When the approval wait times out, the channel button is re-posted at bottom."""
         cog = self._make_cog(bot)
         thread, parent = self._make_thread_with_parent()
 
@@ -1153,21 +1779,8 @@ class TestApprovalButton:
             ]
         )
 
-        call_count = 0
-
-        async def wait_for_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise TimeoutError
-            # Second call: approve
-            event = MagicMock()
-            event.message_id = 99999
-            event.emoji = "✅"
-            event.user_id = 42
-            return event
-
-        bot.wait_for = AsyncMock(side_effect=wait_for_side_effect)
+        cog._drain_timeout = 0.01  # type: ignore[assignment]
+        _approve_on_reminder(bot, thread, thread.send.return_value)
 
         await cog._wait_for_approval(MagicMock(), thread)
 
@@ -1188,11 +1801,7 @@ class TestApprovalButton:
 
         bot.user = MagicMock()
         bot.user.id = 1
-        reaction_event = MagicMock()
-        reaction_event.message_id = 99999
-        reaction_event.emoji = "✅"
-        reaction_event.user_id = 42
-        bot.wait_for = AsyncMock(return_value=reaction_event)
+        _approve_on_listen(bot)
 
         await cog._wait_for_approval(MagicMock(), thread)
 
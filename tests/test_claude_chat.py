@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import discord
 import pytest
@@ -118,6 +118,27 @@ class TestStopCommand:
         # Still in dict — _run_claude's finally handles removal
         assert thread_id in cog._active_runners
 
+    @pytest.mark.asyncio
+    async def test_clear_tolerates_cleanup_during_kill(self) -> None:
+        """/clear must not fail if the session releases itself while being killed."""
+        cog = _make_cog()
+        thread_id = 12345
+        interaction = _make_thread_interaction(thread_id=thread_id)
+
+        mock_runner = MagicMock()
+        cog._active_runners[thread_id] = mock_runner
+
+        async def kill() -> None:
+            cog._release_session(thread_id, mock_runner, None)
+
+        mock_runner.kill = AsyncMock(side_effect=kill)
+
+        await cog.clear_session.callback(cog, interaction)
+
+        mock_runner.kill.assert_awaited_once()
+        assert thread_id not in cog._active_runners
+        cog.repo.delete.assert_awaited_once_with(thread_id)
+
     @pytest.mark.asyncio
     async def test_stop_sends_stopped_embed(self) -> None:
         """/stop success response should use the stopped_embed (orange, not red)."""
@@ -184,7 +205,145 @@ class TestRegistryAutoDiscovery:
         assert cog._registry is None
 
 
-class TestInterruptOnNewMessage:
+class TestSessionBookkeeping:
+    """_active_runners / _active_tasks and the idle_event derived from them."""
+
+    @pytest.mark.asyncio
+    async def test_idle_event_cleared_while_session_runs(self) -> None:
+        cog = _make_cog()
+        cog._dashboard = None
+        cog.bot.thread_dashboard = None
+        cog._settings_repo = None
+        cog._build_runner_for_thread = AsyncMock(return_value=MagicMock())
+        thread = MagicMock(spec=discord.Thread)
+        thread.id = 42
+        user_message = MagicMock(spec=discord.Message)
+        user_message.add_reaction = AsyncMock()
+        user_message.remove_reaction = AsyncMock()
+        seen: list[bool] = []
+
+        async def run(config: object) -> None:
+            seen.append(cog.idle_event.is_set())
+
+        assert cog.idle_event.is_set()
+        with patch("claude_discord.cogs.claude_chat.run_claude_with_config", side_effect=run):
+            await cog._run_claude(user_message, thread, "hi", session_id=None, chat_only=True)
+
+        assert seen == [False]
+        assert cog.idle_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_finishes_when_cancelled_again(self) -> None:
+        """A second cancel during cleanup must not skip the dashboard transition."""
+        from claude_discord.discord_ui.thread_dashboard import ThreadState
+
+        cog = _make_cog()
+        cog._settings_repo = None
+        cog._build_runner_for_thread = AsyncMock(return_value=MagicMock())
+        cleanup_started = asyncio.Event()
+        release_cleanup = asyncio.Event()
+        states: list[ThreadState] = []
+
+        async def set_state(thread_id: int, state: ThreadState, *args, **kwargs) -> None:
+            if state == ThreadState.WAITING_INPUT:
+                cleanup_started.set()
+                await release_cleanup.wait()
+            states.append(state)
+
+        cog._dashboard = MagicMock()
+        cog._dashboard.set_state = AsyncMock(side_effect=set_state)
+        thread = MagicMock(spec=discord.Thread)
+        thread.id = 42
+        user_message = MagicMock(spec=discord.Message)
+        user_message.add_reaction = AsyncMock()
+        user_message.remove_reaction = AsyncMock()
+
+        async def run_forever(config: object) -> None:
+            await asyncio.Event().wait()
+
+        with patch(
+            "claude_discord.cogs.claude_chat.run_claude_with_config", side_effect=run_forever
+        ):
+            task = asyncio.create_task(
+                cog._run_claude(user_message, thread, "hi", session_id=None, chat_only=True)
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            await cleanup_started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release_cleanup.set()
+            await asyncio.sleep(0)
+
+        assert states == [ThreadState.PROCESSING, ThreadState.WAITING_INPUT]
+        assert 42 not in cog._thread_locks
+        assert cog.idle_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_newer_session_in_same_thread(self) -> None:
+        """A session finishing late must not drop a newer session's runner."""
+        cog = _make_cog()
+        cog._dashboard = None
+        cog.bot.thread_dashboard = None
+        cog._settings_repo = None
+        cog._build_runner_for_thread = AsyncMock(return_value=MagicMock())
+        thread = MagicMock(spec=discord.Thread)
+        thread.id = 42
+        user_message = MagicMock(spec=discord.Message)
+        user_message.add_reaction = AsyncMock()
+        user_message.remove_reaction = AsyncMock()
+        newer_runner = MagicMock()
+
+        async def replaced_mid_run(config: object) -> None:
+            cog._active_runners[thread.id] = newer_runner
+
+        with patch(
+            "claude_discord.cogs.claude_chat.run_claude_with_config", side_effect=replaced_mid_run
+        ):
+            await cog._run_claude(user_message, thread, "hi", session_id=None, chat_only=True)
+
+        assert cog._active_runners == {42: newer_runner}
+        assert not cog.idle_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_late_cleanup_leaves_newer_session_lock_and_dashboard(self) -> None:
+        """An old task finishing after a newer runner took over keeps its lock and state."""
+        from claude_discord.discord_ui.thread_dashboard import ThreadState
+
+        cog = _make_cog()
+        cog._settings_repo = None
+        cog._build_runner_for_thread = AsyncMock(return_value=MagicMock())
+        states: list[ThreadState] = []
+
+        async def set_state(thread_id: int, state: ThreadState, *args, **kwargs) -> None:
+            states.append(state)
+
+        cog._dashboard = MagicMock()
+        cog._dashboard.set_state = AsyncMock(side_effect=set_state)
+        thread = MagicMock(spec=discord.Thread)
+        thread.id = 42
+        user_message = MagicMock(spec=discord.Message)
+        user_message.add_reaction = AsyncMock()
+        user_message.remove_reaction = AsyncMock()
+        newer_runner = MagicMock()
+        newer_lock = asyncio.Lock()
+
+        async def superseded_mid_run(config: object) -> None:
+            # The handover gave up on this task and a new session started.
+            cog._active_runners[thread.id] = newer_runner
+            cog._thread_locks[thread.id] = newer_lock
+
+        with patch(
+            "claude_discord.cogs.claude_chat.run_claude_with_config",
+            side_effect=superseded_mid_run,
+        ):
+            await cog._run_claude(user_message, thread, "hi", session_id=None, chat_only=True)
+
+        assert cog._active_runners == {42: newer_runner}
+        assert cog._thread_locks[42] is newer_lock
+        assert ThreadState.WAITING_INPUT not in states
+
     """New message in active thread should interrupt the running session."""
 
     def _make_thread_message(self, thread_id: int = 42) -> MagicMock:
@@ -239,6 +398,31 @@ class TestInterruptOnNewMessage:
         sent_text: str = thread.send.call_args.args[0]
         assert "interrupted" in sent_text.lower() or "⚡" in sent_text
 
+    @pytest.mark.asyncio
+    async def test_session_lookup_overlaps_prompt_building(self) -> None:
+        """repo.get and attachment handling run concurrently, not back to back."""
+        cog = _make_cog()
+        message = self._make_thread_message(thread_id=42)
+        build_started = asyncio.Event()
+        record = MagicMock(session_id="sess-1", working_dir=None)
+
+        async def slow_get(thread_id: int) -> MagicMock:
+            # Only completes if prompt building started without waiting for us.
+            await asyncio.wait_for(build_started.wait(), timeout=1)
+            return record
+
+        async def build(msg: object) -> tuple[str, list]:
+            build_started.set()
+            return "new instruction", []
+
+        cog.repo.get = AsyncMock(side_effect=slow_get)
+        cog._build_prompt_and_images = build
+        cog._run_claude = AsyncMock()
+
+        await cog._handle_thread_reply(message)
+
+        assert cog._run_claude.call_args.kwargs["session_id"] == "sess-1"
+
     @pytest.mark.asyncio
     async def test_no_interrupt_when_no_active_runner(self) -> None:
         """When no runner is active, _handle_thread_reply skips interrupt."""
@@ -287,6 +471,60 @@ class TestInterruptOnNewMessage:
 
         assert call_order == ["task_done", "new_session_started"]
 
+    @pytest.mark.asyncio
+    async def test_stuck_task_is_killed_after_handover_timeout(self) -> None:
+        """A task that outlives the handover timeout gets its runner killed, then is awaited."""
+        cog = _make_cog()
+        thread_id = 42
+        message = self._make_thread_message(thread_id)
+
+        killed = asyncio.Event()
+        existing_runner = MagicMock()
+        existing_runner.interrupt = AsyncMock()
+        existing_runner.kill = AsyncMock(side_effect=killed.set)
+        cog._active_runners[thread_id] = existing_runner
+        call_order: list[str] = []
+
+        async def stuck_task() -> None:
+            await killed.wait()
+            call_order.append("task_done")
+
+        cog._active_tasks[thread_id] = asyncio.ensure_future(stuck_task())
+
+        async def run_claude_stub(*args, **kwargs) -> None:
+            call_order.append("new_session_started")
+
+        cog._run_claude = run_claude_stub
+
+        with patch("claude_discord.cogs.claude_chat._HANDOVER_TIMEOUT", 0.01):
+            await cog._handle_thread_reply(message)
+
+        existing_runner.kill.assert_awaited_once()
+        assert call_order == ["task_done", "new_session_started"]
+
+    @pytest.mark.asyncio
+    async def test_failed_task_does_not_block_new_session(self) -> None:
+        cog = _make_cog()
+        thread_id = 42
+        message = self._make_thread_message(thread_id)
+
+        existing_runner = MagicMock()
+        existing_runner.interrupt = AsyncMock()
+        cog._active_runners[thread_id] = existing_runner
+
+        async def failing_task() -> None:
+            raise RuntimeError("cleanup failed")
+
+        task = asyncio.ensure_future(failing_task())
+        cog._active_tasks[thread_id] = task
+        cog._run_claude = AsyncMock()
+
+        await cog._handle_thread_reply(message)
+
+        cog._run_claude.assert_awaited_once()
+        existing_runner.kill.assert_not_called()
+        assert isinstance(task.exception(), RuntimeError)
+
     @pytest.mark.asyncio
     async def test_run_claude_called_with_session_id_after_interrupt(self) -> None:
         """After interrupt, _run_claude is called with the session_id from the DB."""
@@ -657,6 +895,59 @@ class TestOnReady:
         # delete was still called (single-fire)
         resume_repo.delete.assert_called_once_with(1)
 
+    @pytest.mark.asyncio
+    async def test_on_ready_resumes_entries_concurrently(self) -> None:
+        """One slow or failing entry must not hold up or abort the others."""
+        from claude_discord.database.resume_repo import PendingResume, PendingResumeRepository
+
+        entries = [
+            PendingResume(
+                id=i,
+                thread_id=100 + i,
+                session_id=None,
+                reason="self_restart",
+                resume_prompt="Continue.",
+                created_at="2026-02-21 20:00:00",
+            )
+            for i in range(3)
+        ]
+        resume_repo = MagicMock(spec=PendingResumeRepository)
+        resume_repo.get_pending = AsyncMock(return_value=entries)
+        release = asyncio.Event()
+        sent: list[int] = []
+
+        async def delete(entry_id: int) -> None:
+            if entry_id == 0:
+                await release.wait()
+            elif entry_id == 1:
+                raise RuntimeError("db locked")
+
+        resume_repo.delete = AsyncMock(side_effect=delete)
+
+        def get_channel(thread_id: int) -> MagicMock:
+            thread = MagicMock(spec=discord.Thread)
+            thread.id = thread_id
+            thread.parent = MagicMock(spec=discord.TextChannel)
+
+            async def send(content: str) -> MagicMock:
+                sent.append(thread_id)
+                if len(sent) == 1:
+                    release.set()
+                return MagicMock()
+
+            thread.send = send
+            return thread
+
+        bot = MagicMock()
+        bot.get_channel.side_effect = get_channel
+        cog = ClaudeChatCog(bot=bot, repo=MagicMock(), runner=MagicMock(), resume_repo=resume_repo)
+
+        with patch.object(cog, "_run_claude", new=AsyncMock()):
+            await asyncio.wait_for(cog.on_ready(), timeout=1)
+            await asyncio.sleep(0)
+
+        assert sent == [102, 100]
+
 
 class TestCogUnloadMarkForResume:
     """Tests for cog_unload() auto-marking active sessions for restart-resume."""
@@ -1082,6 +1373,17 @@ class TestMultiChannelSupport:
 
         cog._handle_thread_reply.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_unwatched_channel_rejected_before_author_checks(self) -> None:
+        """Messages in unwatched channels are dropped on routing alone."""
+        cog = self._make_cog_with_channels({111, 222})
+        msg = self._make_message(channel_id=333)
+        author = MagicMock()
+        type(author).bot = PropertyMock(side_effect=AssertionError("author inspected"))
+        msg.author = author
+
+        await cog.on_message(msg)
+
 
 class TestMentionOnlyChannels:
     """mention_only_channel_ids: bot only responds when @mentioned in those channels."""
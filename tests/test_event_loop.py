@@ -0,0 +1,54 @@
+"""Tests for claude_discord.utils.event_loop.run()."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from claude_discord.utils.event_loop import run, use_eager_tasks
+
+
+async def _noop() -> None:
+    return None
+
+
+class TestRun:
+    def test_uses_uvloop_when_installed(self) -> None:
+        uvloop = ModuleType("uvloop")
+        uvloop.run = MagicMock(side_effect=lambda coro: coro.close())  # type: ignore[attr-defined]
+
+        with (
+            patch.dict(sys.modules, {"uvloop": uvloop}),
+            patch("asyncio.run") as asyncio_run,
+        ):
+            run(_noop())
+
+        uvloop.run.assert_called_once()  # type: ignore[attr-defined]
+        asyncio_run.assert_not_called()
+
+    def test_falls_back_to_asyncio_without_uvloop(self) -> None:
+        with (
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("asyncio.run", wraps=asyncio.run) as asyncio_run,
+        ):
+            run(_noop())
+
+        asyncio_run.assert_called_once()
+
+
+class TestUseEagerTasks:
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="eager_task_factory is 3.12+")
+    def test_installs_eager_task_factory(self) -> None:
+        loop = MagicMock(spec=asyncio.AbstractEventLoop)
+        use_eager_tasks(loop)
+        loop.set_task_factory.assert_called_once_with(asyncio.eager_task_factory)
+
+    @pytest.mark.skipif(sys.version_info >= (3, 12), reason="only a no-op before 3.12")
+    def test_noop_before_python_312(self) -> None:
+        loop = MagicMock(spec=asyncio.AbstractEventLoop)
+        use_eager_tasks(loop)
+        loop.set_task_factory.assert_not_called()
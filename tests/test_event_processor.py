@@ -11,7 +11,8 @@ run_claude_with_config() pipeline.
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
@@ -131,6 +132,20 @@ class TestOnSystem:
             thread.id, "existing-sess", working_dir=runner.working_dir
         )
 
+    @pytest.mark.asyncio
+    async def test_repeated_system_events_save_once(
+        self, thread: MagicMock, runner: MagicMock
+    ) -> None:
+        repo = MagicMock()
+        repo.save = AsyncMock()
+        config = _make_config(thread, runner, repo=repo)
+        p = EventProcessor(config)
+
+        for sid in ("s1", "s1", "s1", "s2"):
+            await p.process(StreamEvent(message_type=MessageType.SYSTEM, session_id=sid))
+
+        assert [c.args[1] for c in repo.save.call_args_list] == ["s1", "s2"]
+
     @pytest.mark.asyncio
     async def test_summary_truncated_to_100_chars(
         self, thread: MagicMock, runner: MagicMock
@@ -538,6 +553,25 @@ class TestOnComplete:
         answer_sends = [c for c in text_sends if "Answer." in c.args[0]]
         assert len(answer_sends) == 1  # Sent exactly once, not twice
 
+    @pytest.mark.asyncio
+    async def test_long_result_text_is_chunked_off_the_loop_thread(
+        self, thread: MagicMock, runner: MagicMock
+    ) -> None:
+        config = _make_config(thread, runner)
+        p = EventProcessor(config)
+        loop_thread = threading.get_ident()
+        chunk_threads: list[int] = []
+
+        def _chunk(text: str) -> list[str]:
+            chunk_threads.append(threading.get_ident())
+            return [text[:10]]
+
+        with patch("claude_discord.cogs.event_processor.chunk_message", side_effect=_chunk):
+            await p.process(_make_result_event(text="x" * 5000, session_id="s1"))
+
+        assert chunk_threads and chunk_threads[0] != loop_thread
+        thread.send.assert_any_call("x" * 10)
+
 
 class TestConnectionErrorResilience:
     """Discord/aiohttp connection errors must not crash the session.
@@ -598,13 +632,14 @@ class TestFinalize:
         config = _make_config(thread, runner)
         p = EventProcessor(config)
 
-        fake_task = MagicMock(spec=asyncio.Task)
-        fake_task.done.return_value = False
-        p._state.active_timers["t1"] = fake_task
+        timers = [asyncio.create_task(asyncio.sleep(60)) for _ in range(2)]
+        p._state.active_timers["t1"] = timers[0]
+        p._state.active_timers["t2"] = timers[1]
 
         await p.finalize()
 
-        fake_task.cancel.assert_called_once()
+        # finalize() returns only once the timers have actually stopped.
+        assert all(t.cancelled() for t in timers)
         assert len(p._state.active_timers) == 0
 
     @pytest.mark.asyncio
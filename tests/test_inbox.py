@@ -192,6 +192,7 @@ async def test_dashboard_inbox_cleared_after_remove(repo):
     # Now remove it
     await repo.remove(555)
     await dashboard.refresh_inbox(repo)
+    await dashboard.flush()  # the second refresh falls inside the rate-limit window
 
     embed = channel.send.return_value.edit.call_args[1]["embed"]
     field_names = [f.name for f in embed.fields]
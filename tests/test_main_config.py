@@ -73,6 +73,7 @@ class TestLoadConfig:
         assert config["max_concurrent"] == "3"
         assert config["timeout"] == "300"
         assert config["custom_cogs_dir"] == ""
+        assert config["eager_tasks"] == "false"
 
     def test_all_optional_env_vars(self) -> None:
         """Optional env vars are correctly read."""
@@ -99,6 +100,7 @@ class TestLoadConfig:
                     "CLAUDE_ALLOWED_TOOLS": "Read,Write",
                     "CUSTOM_COGS_DIR": "/my/cogs",
                     "CLI_SESSIONS_PATH": "~/.claude/projects",
+                    "CCDB_EAGER_TASKS": "true",
                 },
                 clear=True,
             ),
@@ -116,6 +118,7 @@ class TestLoadConfig:
         assert config["allowed_tools"] == "Read,Write"
         assert config["custom_cogs_dir"] == "/my/cogs"
         assert config["cli_sessions_path"] == "~/.claude/projects"
+        assert config["eager_tasks"] == "true"
 
     def test_cli_sessions_path_defaults_to_empty(self) -> None:
         """CLI_SESSIONS_PATH defaults to empty string when not set."""
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 import os
 import tempfile
+import threading
+import weakref
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
 from PIL import Image
 
+from claude_discord.cogs import prompt_builder
 from claude_discord.cogs.prompt_builder import (
     MAX_ATTACHMENT_BYTES,
     MAX_ATTACHMENTS,
@@ -54,6 +58,17 @@ class TestBuildPromptAndImages:
         assert prompt == "hello"
         assert images == []
 
+    @pytest.mark.asyncio
+    async def test_only_skipped_attachments_returns_content_unchanged(self) -> None:
+        att = _make_attachment(filename="report.pdf", content_type="application/pdf")
+        msg = _make_message(content="hello", attachments=[att])
+
+        prompt, images = await build_prompt_and_images(msg)
+
+        assert prompt == "hello"
+        assert images == []
+        att.read.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_text_attachment_appended(self) -> None:
         att = _make_attachment(filename="notes.txt", content=b"file content here")
@@ -246,6 +261,78 @@ class TestBuildPromptAndImages:
         assert prompt == "see this"
         assert images == []
 
+    @pytest.mark.asyncio
+    async def test_attachments_downloaded_concurrently_in_order(self) -> None:
+        """All reads are in flight together; sections keep the attachment order."""
+        second_started = asyncio.Event()
+
+        async def slow_read() -> bytes:
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+            return b"alpha"
+
+        async def fast_read() -> bytes:
+            second_started.set()
+            return b"beta"
+
+        first = _make_attachment(filename="a.txt")
+        first.read = AsyncMock(side_effect=slow_read)
+        second = _make_attachment(filename="b.txt")
+        second.read = AsyncMock(side_effect=fast_read)
+        msg = _make_message(content="", attachments=[first, second])
+
+        prompt, _ = await build_prompt_and_images(msg)
+
+        assert prompt.index("alpha") < prompt.index("beta")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_respect_global_limit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(prompt_builder, "MAX_CONCURRENT_READS", 2)
+        monkeypatch.setattr(prompt_builder, "_read_semaphores", weakref.WeakKeyDictionary())
+        in_flight = 0
+        peak = 0
+
+        async def read() -> bytes:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return b"data"
+
+        attachments = []
+        for i in range(4):
+            att = _make_attachment(filename=f"{i}.txt")
+            att.read = AsyncMock(side_effect=read)
+            attachments.append(att)
+        msg = _make_message(content="", attachments=attachments)
+
+        prompt, _ = await build_prompt_and_images(msg)
+
+        assert peak == 2
+        assert prompt.count("data") == 4
+
+    def test_read_limit_works_across_event_loops(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Contended reads succeed on a second event loop after the first has closed."""
+        monkeypatch.setattr(prompt_builder, "MAX_CONCURRENT_READS", 1)
+        monkeypatch.setattr(prompt_builder, "_read_semaphores", weakref.WeakKeyDictionary())
+
+        async def read() -> bytes:
+            await asyncio.sleep(0)
+            return b"data"
+
+        async def contended_reads() -> list[bytes]:
+            attachments = []
+            for i in range(2):
+                att = _make_attachment(filename=f"{i}.txt")
+                att.read = AsyncMock(side_effect=read)
+                attachments.append(att)
+            return await asyncio.gather(*(prompt_builder._read_attachment(a) for a in attachments))
+
+        assert asyncio.run(contended_reads()) == [b"data", b"data"]
+        assert asyncio.run(contended_reads()) == [b"data", b"data"]
+
 
 class TestNoContentType:
     """content_type が None のとき（Discord のロングテキスト自動変換等）の動作。"""
@@ -471,6 +558,27 @@ class TestBmpImageConversionIntegration:
         assert images[0].media_type == "image/png"
         assert images[0].data == base64.standard_b64encode(png_bytes).decode("ascii")
 
+    @pytest.mark.asyncio
+    async def test_conversion_runs_off_the_event_loop_thread(self) -> None:
+        """Image conversion/encoding is blocking work and must not run on the loop thread."""
+        threads: list[int] = []
+
+        def record_thread(raw: bytes, media_type: str) -> tuple[bytes, str]:
+            threads.append(threading.get_ident())
+            return raw, media_type
+
+        att = _make_attachment(filename="a.png", content_type="image/png", content=b"PNG")
+        msg = _make_message(content="", attachments=[att])
+
+        with patch(
+            "claude_discord.cogs.prompt_builder._convert_image_if_needed",
+            side_effect=record_thread,
+        ):
+            _, images = await build_prompt_and_images(msg)
+
+        assert len(images) == 1
+        assert threads and threads[0] != threading.get_ident()
+
 
 class TestLargeTextAttachment:
     """大きいテキスト添付ファイル（Discord ロングテキスト自動変換等）の動作。"""
@@ -513,6 +621,22 @@ class TestLargeTextAttachment:
         # 末尾の END は切り詰められて含まれない
         assert "END" not in prompt
 
+    @pytest.mark.asyncio
+    async def test_huge_text_attachment_decodes_only_shown_prefix(self) -> None:
+        """Only the displayable prefix is decoded; the notice reports the full size."""
+        content = "é".encode() * 1_000_000  # 2 MB, 1M characters
+        att = _make_attachment(
+            filename="huge.log", content_type="text/plain", content=content, size=len(content)
+        )
+        msg = _make_message(content="", attachments=[att])
+
+        prompt, _ = await build_prompt_and_images(msg)
+
+        body = prompt.split("---\n", 1)[1]
+        assert body.startswith("é" * MAX_ATTACHMENT_BYTES + "\n... [truncated")
+        assert "\ufffd" not in body
+        assert f"of {len(content) // 1000}KB]" in body
+
 
 class TestSaveAttachmentsToDisk:
     """save_dir が指定されたとき、全添付ファイルがディスクに保存される。"""
@@ -1,4 +1,4 @@
-"""Tests for DrainAware protocol."""
+"""Tests for DrainAware, ActiveRunnerAware and IdleSignaling protocols."""
 
 from __future__ import annotations
 
@@ -7,7 +7,7 @@ from unittest.mock import MagicMock
 from claude_discord.claude.runner import ClaudeRunner
 from claude_discord.cogs.claude_chat import ClaudeChatCog
 from claude_discord.cogs.webhook_trigger import WebhookTriggerCog
-from claude_discord.protocols import DrainAware
+from claude_discord.protocols import ActiveRunnerAware, DrainAware, IdleSignaling
 
 
 class TestDrainAwareProtocol:
@@ -48,3 +48,58 @@ class TestDrainAwareProtocol:
                 return 42
 
         assert isinstance(CustomCog(), DrainAware)
+
+
+class TestActiveRunnerAwareProtocol:
+    """ActiveRunnerAware lets AutoUpgradeCog find running sessions without duck typing."""
+
+    def test_claude_chat_cog_satisfies_protocol(self) -> None:
+        bot = MagicMock()
+        bot.channel_id = 999
+        cog = ClaudeChatCog(
+            bot=bot,
+            repo=MagicMock(),
+            runner=MagicMock(spec=ClaudeRunner),
+        )
+        assert isinstance(cog, ActiveRunnerAware)
+        assert cog.active_thread_ids() == frozenset()
+
+    def test_webhook_trigger_cog_does_not_satisfy(self) -> None:
+        cog = WebhookTriggerCog(
+            bot=MagicMock(),
+            runner=MagicMock(spec=ClaudeRunner),
+            triggers={},
+        )
+        assert not isinstance(cog, ActiveRunnerAware)
+
+
+class TestIdleSignalingProtocol:
+    """IdleSignaling is an optional add-on to DrainAware."""
+
+    def test_claude_chat_cog_satisfies_protocol(self) -> None:
+        bot = MagicMock()
+        bot.channel_id = 999
+        cog = ClaudeChatCog(
+            bot=bot,
+            repo=MagicMock(),
+            runner=MagicMock(spec=ClaudeRunner),
+        )
+        assert isinstance(cog, IdleSignaling)
+        assert cog.idle_event.is_set()
+
+    def test_webhook_trigger_cog_satisfies_protocol(self) -> None:
+        cog = WebhookTriggerCog(
+            bot=MagicMock(),
+            runner=MagicMock(spec=ClaudeRunner),
+            triggers={},
+        )
+        assert isinstance(cog, IdleSignaling)
+        assert cog.idle_event.is_set()
+
+    def test_drain_aware_only_object_does_not_satisfy(self) -> None:
+        class CountOnly:
+            @property
+            def active_count(self) -> int:
+                return 0
+
+        assert not isinstance(CountOnly(), IdleSignaling)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
@@ -21,12 +21,12 @@ from claude_discord.claude.types import (
 from claude_discord.cogs import _run_helper as _rh_module
 from claude_discord.cogs._run_helper import (
     TOOL_RESULT_MAX_CHARS,
-    _make_error_embed,
     _truncate_result,
     configure_session_limit,
     run_claude_in_thread,
     run_claude_with_config,
 )
+from claude_discord.cogs.event_processor import _make_error_embed
 from claude_discord.cogs.run_config import RunConfig
 from claude_discord.concurrency import SessionRegistry
 from claude_discord.discord_ui.streaming_manager import StreamingMessageManager
@@ -1456,7 +1456,7 @@ class TestGlobalSessionSemaphore:
     def test_configure_session_limit_sets_semaphore(self) -> None:
         configure_session_limit(5)
         assert _rh_module._max_concurrent == 5
-        assert isinstance(_rh_module._global_semaphore, asyncio.Semaphore)
+        assert isinstance(_rh_module._global_semaphore, asyncio.BoundedSemaphore)
 
     @pytest.mark.asyncio
     async def test_semaphore_limits_concurrent_sessions(self, thread: MagicMock) -> None:
@@ -1498,9 +1498,12 @@ class TestGlobalSessionSemaphore:
         await asyncio.gather(t1, t2, t3)
 
     @pytest.mark.asyncio
-    async def test_waiting_message_sent_when_full(self, thread: MagicMock) -> None:
+    async def test_waiting_message_sent_when_full(
+        self, thread: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """When all slots are taken, a waiting message should be posted."""
         configure_session_limit(1)
+        monkeypatch.setattr(_rh_module, "_SLOT_NOTICE_DELAY", 0.01)
 
         gate = asyncio.Event()
         started = asyncio.Event()
@@ -1535,6 +1538,51 @@ class TestGlobalSessionSemaphore:
         ]
         assert len(waiting_msgs) >= 1
 
+    @pytest.mark.asyncio
+    async def test_no_waiting_message_when_slot_frees_quickly(self, thread: MagicMock) -> None:
+        configure_session_limit(1)
+        sem = _rh_module._global_semaphore
+        await sem.acquire()
+
+        runner = MagicMock()
+        runner.working_dir = None
+        runner.images = None
+        runner.run = self._make_async_gen(self._simple_events())
+        config = RunConfig(thread=thread, runner=runner, prompt="test")
+
+        task = asyncio.create_task(run_claude_with_config(config))
+        await asyncio.sleep(0.01)
+        sem.release()
+        await task
+
+        waiting_msgs = [
+            c
+            for c in thread.send.call_args_list
+            if c.args and isinstance(c.args[0], str) and "\u23f3" in c.args[0]
+        ]
+        assert waiting_msgs == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_while_waiting_does_not_leak_slot(self, thread: MagicMock) -> None:
+        configure_session_limit(1)
+        sem = _rh_module._global_semaphore
+        await sem.acquire()
+
+        runner = MagicMock()
+        runner.working_dir = None
+        runner.images = None
+        runner.run = self._make_async_gen(self._simple_events())
+        config = RunConfig(thread=thread, runner=runner, prompt="test")
+
+        task = asyncio.create_task(run_claude_with_config(config))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        sem.release()
+
+        assert not sem.locked()
+
     @pytest.mark.asyncio
     async def test_semaphore_released_on_error(self, thread: MagicMock) -> None:
         """Semaphore must be released even when runner.run() raises."""
@@ -1613,6 +1661,43 @@ class TestGlobalSessionSemaphore:
         assert call_count == 2
 
 
+class TestCancellation:
+    @pytest.mark.asyncio
+    async def test_cancel_mid_event_closes_runner_stream(self) -> None:
+        """Cancelling while an event is processed runs the runner's cleanup immediately."""
+        thread = MagicMock(spec=discord.Thread)
+        thread.id = 4242
+        thread.send = AsyncMock()
+        processing = asyncio.Event()
+        stream_closed = asyncio.Event()
+
+        async def stream(*args, **kwargs):
+            try:
+                yield StreamEvent(message_type=MessageType.SYSTEM, session_id="s")
+                yield StreamEvent(message_type=MessageType.RESULT, is_complete=True)
+            finally:
+                stream_closed.set()
+
+        async def blocking_process(self, event: StreamEvent) -> None:
+            processing.set()
+            await asyncio.Event().wait()
+
+        runner = MagicMock()
+        runner.working_dir = None
+        runner.images = None
+        runner.run = stream
+        config = RunConfig(thread=thread, runner=runner, prompt="test")
+
+        with patch.object(_rh_module.EventProcessor, "process", blocking_process):
+            task = asyncio.create_task(run_claude_with_config(config))
+            await processing.wait()
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        assert stream_closed.is_set()
+
+
 class TestDrainAllowsResultEvent:
     """RESULT events must be processed even when should_drain is True.
 
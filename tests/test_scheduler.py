@@ -215,6 +215,41 @@ class TestSchedulerCogMasterLoop:
         run_config = mock_run.call_args[0][0]
         assert run_config.repo is None
 
+    async def test_run_task_concurrency_is_bounded(
+        self, cog: SchedulerCog, repo: TaskRepository
+    ) -> None:
+        """Tasks beyond the limit wait (still marked running) before creating threads."""
+        import discord
+
+        cog._task_sem = asyncio.Semaphore(1)
+        tasks = [
+            await repo.get(
+                await repo.create(name=f"t{i}", prompt="p", interval_seconds=60, channel_id=99)
+            )
+            for i in range(2)
+        ]
+
+        mock_starter_msg = AsyncMock()
+        mock_starter_msg.create_thread = AsyncMock(return_value=AsyncMock(spec=discord.Thread))
+        mock_channel = AsyncMock(spec=discord.TextChannel)
+        mock_channel.send = AsyncMock(return_value=mock_starter_msg)
+        cog.bot.get_channel = MagicMock(return_value=mock_channel)
+        release = asyncio.Event()
+
+        async def run(config: object) -> None:
+            await release.wait()
+
+        with patch("claude_discord.cogs.scheduler.run_claude_with_config", side_effect=run):
+            running = [asyncio.create_task(cog._run_task(t)) for t in tasks]
+            await asyncio.sleep(0.01)
+            assert mock_channel.send.await_count == 1
+            assert cog._running == {tasks[0]["id"], tasks[1]["id"]}
+            release.set()
+            await asyncio.gather(*running)
+
+        assert mock_channel.send.await_count == 2
+        assert cog._running == set()
+
     async def test_disabled_task_not_run(self, cog: SchedulerCog, repo: TaskRepository) -> None:
         """Disabled tasks should not fire even if overdue."""
         task_id = await repo.create(name="dis", prompt="p", interval_seconds=60, channel_id=1)
@@ -53,6 +53,21 @@ class TestGetBySessionId:
         result = await repo.get_by_session_id("nonexistent")
         assert result is None
 
+    async def test_existing_session_ids_returns_stored_subset(self, repo):
+        await repo.save(thread_id=2001, session_id="known-1")
+        await repo.save(thread_id=2002, session_id="known-2")
+        result = await repo.existing_session_ids(["known-1", "missing", "known-2"])
+        assert result == {"known-1", "known-2"}
+
+    async def test_existing_session_ids_spans_batches(self, repo, monkeypatch):
+        from claude_code_core import session_repo
+
+        monkeypatch.setattr(session_repo, "_IN_CLAUSE_BATCH", 2)
+        for i in range(3):
+            await repo.save(thread_id=2100 + i, session_id=f"s-{i}")
+        result = await repo.existing_session_ids(["s-0", "x", "s-1", "s-2"])
+        assert result == {"s-0", "s-1", "s-2"}
+
 
 class TestListAll:
     """Test listing all sessions."""
@@ -876,3 +891,35 @@ class TestExtractRecentMessages:
         result = extract_recent_messages(str(tmp_path), sid, count=5)
         assert len(result) == 1
         assert result[0].content == "From subdir"
+
+
+class TestSyncCliSessions:
+    """Test the sync_cli_sessions import loop."""
+
+    async def test_duplicate_session_ids_imported_once(self, repo, monkeypatch):
+        """A session_id returned twice by the scan gets a single thread and row."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from claude_discord.cogs import session_sync
+
+        dup = CliSession(session_id="dup-1", working_dir="/a", summary="A", timestamp="")
+        other = CliSession(session_id="new-2", working_dir="/b", summary="B", timestamp="")
+        monkeypatch.setattr(session_sync, "scan_cli_sessions", lambda *a, **kw: [dup, other, dup])
+        threads = iter([MagicMock(id=3001), MagicMock(id=3002), MagicMock(id=3003)])
+        create_thread = AsyncMock(side_effect=lambda *a: next(threads))
+        monkeypatch.setattr(session_sync, "create_sync_thread", create_thread)
+        monkeypatch.setattr(session_sync, "post_recent_messages", AsyncMock())
+
+        result = await session_sync.sync_cli_sessions(
+            cli_sessions_path="/unused",
+            channel=MagicMock(),
+            repo=repo,
+            thread_style="message",
+            since_hours=0,
+            min_results=0,
+        )
+
+        assert result.imported == 2
+        assert result.skipped == 1
+        assert create_thread.await_count == 2
+        assert [r.session_id for r in await repo.list_all()].count("dup-1") == 1
@@ -9,6 +9,8 @@ import pytest
 
 from claude_discord.claude.types import ToolCategory
 from claude_discord.discord_ui.status import (
+    DEBOUNCE_MS,
+    EMOJI_THINKING,
     STALL_HARD_SECONDS,
     StatusManager,
 )
@@ -125,3 +127,21 @@ class TestCompactStatus:
         # Callback should NOT have fired because compact reset the timer
         callback.assert_not_awaited()
         await sm.cleanup()
+
+
+class TestRepeatedStatus:
+    """Repeating the current status must not restart the debounce."""
+
+    @pytest.mark.asyncio
+    async def test_same_status_keeps_pending_debounce(self) -> None:
+        msg = _make_message()
+        sm = StatusManager(msg)
+        await sm.set_thinking()
+        first = sm._debounce_task
+        await sm.set_thinking()
+        assert sm._debounce_task is first
+        await asyncio.sleep(DEBOUNCE_MS / 1000 + 0.2)
+        msg.add_reaction.assert_awaited_once_with(EMOJI_THINKING)
+        await sm.set_thinking()
+        assert sm._debounce_task is first
+        await sm.cleanup()
@@ -69,6 +69,7 @@ def _make_cog(
     repo.save = AsyncMock(return_value=_make_record())
     repo.list_all = AsyncMock(return_value=[])
     repo.get_by_session_id = AsyncMock(return_value=None)
+    repo.existing_session_ids = AsyncMock(return_value=set())
     return SessionManageCog(bot=bot, repo=repo, cli_sessions_path=cli_sessions_path)
 
 
@@ -117,7 +118,7 @@ class TestSyncSessions:
 
         cog = _make_cog(cli_sessions_path=str(tmp_path))
         # Session not yet in DB
-        cog.repo.get_by_session_id = AsyncMock(return_value=None)
+        cog.repo.existing_session_ids = AsyncMock(return_value=set())
         interaction = _make_channel_interaction()
         await cog.sync_sessions.callback(cog, interaction)
 
@@ -152,9 +153,7 @@ class TestSyncSessions:
 
         cog = _make_cog(cli_sessions_path=str(tmp_path))
         # Session already in DB
-        cog.repo.get_by_session_id = AsyncMock(
-            return_value=_make_record(session_id=session_id, origin="cli")
-        )
+        cog.repo.existing_session_ids = AsyncMock(return_value={session_id})
         interaction = _make_channel_interaction()
         await cog.sync_sessions.callback(cog, interaction)
 
@@ -188,7 +187,7 @@ class TestSyncSessionsEmbed:
                 )
 
         cog = _make_cog(cli_sessions_path=str(tmp_path))
-        cog.repo.get_by_session_id = AsyncMock(return_value=None)
+        cog.repo.existing_session_ids = AsyncMock(return_value=set())
         interaction = _make_channel_interaction()
         await cog.sync_sessions.callback(cog, interaction)
 
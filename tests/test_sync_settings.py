@@ -64,6 +64,7 @@ def _make_cog(
     repo.save = AsyncMock(return_value=_make_record())
     repo.list_all = AsyncMock(return_value=[])
     repo.get_by_session_id = AsyncMock(return_value=None)
+    repo.existing_session_ids = AsyncMock(return_value=set())
 
     settings_repo = MagicMock()
     settings_repo.get = AsyncMock(return_value=None)
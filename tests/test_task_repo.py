@@ -223,6 +223,21 @@ class TestTaskRepoUpdateNextRun:
         assert task["anchor_hour"] is None
         assert task["anchor_minute"] is None
 
+    async def test_update_next_runs_advances_each_task(self, repo: TaskRepository) -> None:
+        before = time.time()
+        fast = await repo.create(name="fast", prompt="p", interval_seconds=60, channel_id=1)
+        slow = await repo.create(name="slow", prompt="p", interval_seconds=3600, channel_id=1)
+
+        await repo.update_next_runs([(fast, 60), (slow, 3600)])
+
+        fast_task = await repo.get(fast)
+        slow_task = await repo.get(slow)
+        assert fast_task is not None and slow_task is not None
+        assert before + 60 - 1 <= fast_task["next_run_at"] < before + 3600 - 1
+        assert slow_task["next_run_at"] >= before + 3600 - 1
+        assert fast_task["last_run_at"] is not None
+        assert slow_task["last_run_at"] is not None
+
 
 class TestTaskRepoDelete:
     async def test_delete_existing(self, repo: TaskRepository) -> None:
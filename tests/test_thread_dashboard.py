@@ -5,8 +5,9 @@ Issue: https://github.com/ebibibi/claude-code-discord-bridge/issues/67
 
 from __future__ import annotations
 
+import asyncio
 import time
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
@@ -122,6 +123,39 @@ class TestSetState:
 
         assert dashboard._threads[5].state == ThreadState.WAITING_INPUT
 
+    @pytest.mark.asyncio
+    async def test_rapid_transitions_coalesced_into_trailing_edit(self) -> None:
+        dashboard, channel = _make_dashboard()
+        await dashboard.initialize()
+        msg = channel.send.return_value
+
+        with patch("claude_discord.discord_ui.thread_dashboard._REFRESH_INTERVAL", 0.05):
+            await dashboard.set_state(1, ThreadState.PROCESSING, "a", thread=_make_thread(1))
+            await dashboard.set_state(2, ThreadState.PROCESSING, "b", thread=_make_thread(2))
+            await dashboard.set_state(1, ThreadState.WAITING_INPUT, "a", thread=_make_thread(1))
+            assert msg.edit.await_count == 1
+            await asyncio.sleep(0.1)
+
+        assert msg.edit.await_count == 2
+        embed = msg.edit.call_args.kwargs["embed"]
+        assert [f.name for f in embed.fields] == ["🟡 <#1>", "🟢 <#2>"]
+
+    @pytest.mark.asyncio
+    async def test_flush_applies_pending_edit(self) -> None:
+        dashboard, channel = _make_dashboard()
+        await dashboard.initialize()
+        msg = channel.send.return_value
+
+        await dashboard.set_state(1, ThreadState.PROCESSING, "a")
+        await dashboard.remove(1)
+        assert msg.edit.await_count == 1
+
+        await dashboard.flush()
+
+        assert msg.edit.await_count == 2
+        assert dashboard._pending_refresh is None
+        assert msg.edit.call_args.kwargs["embed"].description == "No active sessions."
+
 
 # ---------------------------------------------------------------------------
 # Owner mention on WAITING_INPUT
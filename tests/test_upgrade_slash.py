@@ -11,6 +11,7 @@ The slash command should:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
@@ -58,7 +59,10 @@ def _make_interaction(channel_id: int = 777) -> MagicMock:
 def _make_process(returncode: int = 0, stdout: bytes = b"ok") -> MagicMock:
     proc = MagicMock()
     proc.returncode = returncode
-    proc.communicate = AsyncMock(return_value=(stdout, b""))
+    proc.stdout = asyncio.StreamReader()
+    proc.stdout.feed_data(stdout)
+    proc.stdout.feed_eof()
+    proc.wait = AsyncMock(return_value=returncode)
     return proc
 
 
@@ -106,16 +110,33 @@ class TestUpgradeSlashCommandEnabled:
         cog = AutoUpgradeCog(bot=bot, config=config)
         interaction = _make_interaction()
 
-        # Simulate lock already held
-        await cog._lock.acquire()
-        try:
-            await cog.upgrade_command.callback(cog, interaction)
-        finally:
-            cog._lock.release()
+        # Simulate an upgrade already in progress
+        cog._upgrading = True
+        await cog.upgrade_command.callback(cog, interaction)
 
         call_args = interaction.response.send_message.call_args
         assert call_args.kwargs.get("ephemeral") is True
 
+    async def test_second_invocation_during_defer_is_rejected(self):
+        """The upgrade is claimed before defer(), so an overlapping call can't queue up."""
+        bot = _make_bot()
+        config = _make_config(slash_command_enabled=True)
+        cog = AutoUpgradeCog(bot=bot, config=config)
+        first = _make_interaction()
+        second = _make_interaction()
+
+        async def defer_and_race() -> None:
+            await cog.upgrade_command.callback(cog, second)
+
+        first.response.defer = AsyncMock(side_effect=defer_and_race)
+        proc = _make_process(returncode=0)
+        with patch(_PATCH_EXEC, return_value=proc):
+            await cog.upgrade_command.callback(cog, first)
+
+        second.response.defer.assert_not_awaited()
+        assert second.response.send_message.call_args.kwargs.get("ephemeral") is True
+        assert cog._upgrading is False
+
     async def test_defers_response_before_long_operation(self):
         """Slash command should defer() so Discord doesn't time out."""
         bot = _make_bot()